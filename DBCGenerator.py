@@ -14,6 +14,8 @@ class DBCGenerator:
         DBC (Database): Loaded or newly created DBC database.
         signal_container (defaultdict): Maps frame IDs to a list of signals for that frame.
         frame_container (list): List of message objects (frames).
+        conversion_cache (dict): Maps (scale, offset, is_float) to a shared conversion object.
+        msg_spec_cache (dict): Maps a VFrameFormat override value to a shared DbcSpecifics object.
         dbcSpec (DBCSpecifics): Global DBC specifics containing attribute definitions.
         vframe_format (AttributeDefinition): Definition for VFrameFormat attribute used to tag messages.
     """
@@ -31,7 +33,12 @@ class DBCGenerator:
         self.signal_container = defaultdict(list)
         # List of messages (frames) that will be added to the DBC.
         self.frame_container = []
-        self.conversion = None
+        # Conversion objects keyed by (scale, offset, is_float); signals with the same
+        # scaling share one instance instead of building a new one per signal.
+        self.conversion_cache = {}
+        # Message-level DbcSpecifics keyed by VFrameFormat value; messages with the same
+        # override share one instance.
+        self.msg_spec_cache = {}
         
         # Define the VFrameFormat attribute for message-level information.
         self.vframe_format = candb.can.attribute_definition.AttributeDefinition(
@@ -83,11 +90,14 @@ class DBCGenerator:
             multiplexer_signal: Multiplexer signal flag.
             spn (int, optional): J1939 Suspect Parameter Number.
         """
-        # Create a conversion object if scale and offset are provided.
+        # Look up (or create) a conversion object if scale and offset are provided.
+        conversion = None
         if scale is not None and offset is not None:
-            self.conversion = candb.conversion.BaseConversion.factory(scale=scale, offset=offset, is_float=False)
-        else:
-            self.conversion = None
+            key = (scale, offset, False)
+            conversion = self.conversion_cache.get(key)
+            if conversion is None:
+                conversion = candb.conversion.BaseConversion.factory(scale=scale, offset=offset, is_float=False)
+                self.conversion_cache[key] = conversion
 
         # Create the signal using the cantools Signal class.
         signal = candb.can.Signal(
@@ -98,7 +108,7 @@ class DBCGenerator:
             is_signed=is_signed,
             unit=unit,
             spn=spn,
-            conversion=self.conversion,
+            conversion=conversion,
             raw_initial=raw_initial,
             raw_invalid=raw_invalid,
             minimum=minimum,
@@ -144,12 +154,15 @@ class DBCGenerator:
         # Optionally, create a message-specific dbc_specifics override for VFrameFormat.
         msg_spec_ext = None
         if value is not None:
-            msg_spec_ext = candb.can.formats.dbc_specifics.DbcSpecifics(
-                attributes={'VFrameFormat': candb.can.attribute.Attribute(
-                    value=value,  # 0: Standard CAN, 1: Extended CAN, 3: J1939
-                    definition=self.vframe_format
-                )}
-            )
+            msg_spec_ext = self.msg_spec_cache.get(value)
+            if msg_spec_ext is None:
+                msg_spec_ext = candb.can.formats.dbc_specifics.DbcSpecifics(
+                    attributes={'VFrameFormat': candb.can.attribute.Attribute(
+                        value=value,  # 0: Standard CAN, 1: Extended CAN, 3: J1939
+                        definition=self.vframe_format
+                    )}
+                )
+                self.msg_spec_cache[value] = msg_spec_ext
         # Retrieve signals for the given frame_id.
         signals = self.signal_container[frame_id]
         # Create the message using the cantools Message class.
@@ -20,7 +20,10 @@ class CANInterface:
             'bitrate': bitrate,
             'role': role,  # 'sender', 'receiver', or 'both'
             'bus': None,   # Will be initialized when started
-            'receive_callback': None
+            'notifier': None,
+            'reader': None,
+            'receive_callback': None,
+            'receive_batch_callback': None
         }
         self.logger.info(f"Added interface {name} on {channel} with role {role}")
     
@@ -30,6 +33,15 @@ class CANInterface:
             self.interfaces[interface_name]['receive_callback'] = callback
             self.logger.debug(f"Set receive callback for {interface_name}")
     
+    def set_receive_batch_callback(self, interface_name, callback):
+        """
+        Set callback receiving a list of messages drained in one wake-up.
+        Takes precedence over the per-message receive callback.
+        """
+        if interface_name in self.interfaces:
+            self.interfaces[interface_name]['receive_batch_callback'] = callback
+            self.logger.debug(f"Set receive batch callback for {interface_name}")
+    
     def start(self):
         """Initialize and start all interfaces"""
         self.running = True
@@ -46,6 +58,12 @@ class CANInterface:
                 
                 # Start receiver thread if this interface is a receiver or both
                 if config['role'] in ['receiver', 'both']:
+                    # The notifier reads the bus on its own thread and buffers
+                    # frames so the receive thread can drain them in batches
+                    reader = can.BufferedReader()
+                    self.interfaces[name]['reader'] = reader
+                    self.interfaces[name]['notifier'] = can.Notifier(bus, [reader], timeout=0.1)
+                    
                     thread = threading.Thread(
                         target=self._receive_thread,
                         args=(name,),
@@ -61,16 +79,30 @@ class CANInterface:
     def _receive_thread(self, interface_name):
         """Thread function to receive messages from a specific interface"""
         config = self.interfaces[interface_name]
-        bus = config['bus']
+        reader = config['reader']
         callback = config['receive_callback']
+        batch_callback = config['receive_batch_callback']
         
-        while self.running and bus is not None:
+        while self.running and reader is not None:
             try:
                 # Wait for a message with timeout
-                message = bus.recv(1.0)
-                if message is not None and callback is not None:
-                    # Call the callback with the message and interface name
-                    callback(message, interface_name)
+                message = reader.get_message(timeout=0.1)
+                if message is None:
+                    continue
+                
+                # Drain everything else that is already buffered
+                batch = [message]
+                message = reader.get_message(timeout=0)
+                while message is not None:
+                    batch.append(message)
+                    message = reader.get_message(timeout=0)
+                
+                # Call the callback with the messages and interface name
+                if batch_callback is not None:
+                    batch_callback(batch, interface_name)
+                elif callback is not None:
+                    for message in batch:
+                        callback(message, interface_name)
             except Exception as e:
                 self.logger.error(f"Error receiving from {interface_name}: {e}")
                 time.sleep(0.1)  # Prevent CPU overload on error
@@ -93,6 +125,11 @@ class CANInterface:
         # Wait for threads to finish
         for name, thread in self.receive_threads.items():
             thread.join(timeout=2.0)
+        # Shutdown notifiers before their buses
+        for name, config in self.interfaces.items():
+            if config['notifier'] is not None:
+                config['notifier'].stop()
+                config['notifier'] = None
         # Shutdown bus interfaces
         for name, config in self.interfaces.items():
             if config['bus'] is not None:
@@ -1,34 +1,103 @@
 import can
+import copy
+import re
 import time
 import threading
-import random
+import queue
+import heapq
 import logging
-from collections import defaultdict
+import numpy as np
+
+# Simulated bus transmission time, applied to receiver-side message timestamps
+SIMULATED_TX_DELAY = 0.001
+
+# Random-walk steps generated per refill of a TrendGenerator
+TREND_BATCH_SIZE = 256
+
+# Message name categories and their send periods in seconds (engine data
+# typically 10-100ms, temperature 500-1000ms, status 1000ms); when a name
+# matches several categories the fastest period wins
+_CAT_RE = re.compile(r'engine|temperature|status')
+_FREQ = {'engine': 0.01, 'temperature': 0.5, 'status': 1.0}
+# Period for messages in no category
+DEFAULT_PERIOD = 0.1
+
+# Shared PCG64 generator for all simulator randomness
+_RNG = np.random.default_rng()
+
+def _clamped_walk(walk, start, min_val, max_val):
+    """Turn a batch of steps into a random walk in place, clamping every step"""
+    current = start
+    for i in range(walk.shape[0]):
+        current += walk[i]
+        if current < min_val:
+            current = min_val
+        elif current > max_val:
+            current = max_val
+        walk[i] = current
+
+# Compile the walk when numba is available; the plain loop gives the same walk
+try:
+    from numba import njit
+    HAS_NUMBA = True
+    _clamped_walk = njit(cache=True, nogil=True)(_clamped_walk)
+except ImportError:
+    HAS_NUMBA = False
 
 class TrendGenerator:
     """Generates realistic trend-based values for simulation"""
+    # One instance per DBC signal, so skip the per-instance __dict__
+    __slots__ = ('current', 'min_val', 'max_val', 'volatility', '_buf', '_idx')
+    
     def __init__(self, min_val, max_val, volatility=0.1):
-        self.current = random.uniform(min_val, max_val)
+        # Bounds may arrive inverted from the DBC; NumPy requires low <= high
+        self.current = float(_RNG.uniform(min(min_val, max_val), max(min_val, max_val)))
         self.min_val = min_val
         self.max_val = max_val
         self.volatility = volatility
+        # Precomputed walk served one value at a time, refilled when exhausted.
+        # Filled now so the first send (and any JIT compile) isn't on the
+        # simulation thread
+        self._refill()
     
     def next_value(self):
         """Generate next value in trend"""
-        # Create a realistic trend with random walk
-        change = random.normalvariate(0, self.volatility)
-        self.current += change
-        # Keep within bounds
-        self.current = max(self.min_val, min(self.max_val, self.current))
-        return self.current
+        if self._idx >= TREND_BATCH_SIZE:
+            self._refill()
+        value = self._buf[self._idx]
+        self._idx += 1
+        return value
+    
+    def _refill(self):
+        """Generate the next batch of the random walk in one vectorised pass"""
+        # Create a realistic trend with random walk, kept within bounds
+        walk = _RNG.normal(0.0, abs(self.volatility), TREND_BATCH_SIZE)
+        _clamped_walk(walk, float(self.current), float(self.min_val), float(self.max_val))
+        # Plain floats so callers (cantools encode) never see NumPy scalars
+        self._buf = walk.tolist()
+        self._idx = 0
+        self.current = self._buf[-1]
 
 class DualCANSimulator:
     """Simulates sender and receiver CAN buses for testing"""
     def __init__(self, dbc_parser):
         self.dbc = dbc_parser
-        self.running = False
-        self.sender_callbacks = []
-        self.receiver_callbacks = []
+        # Set while stopped; the simulation loop waits on it between sends so
+        # stop() wakes it immediately. Each start() makes a new one, so threads
+        # left over from a previous run can't be revived by a restart
+        self._stop_event = threading.Event()
+        self._stop_event.set()
+        # Callback collections are immutable tuples replaced on registration, so
+        # adding a callback never disturbs an iteration on the simulation thread
+        self.sender_callbacks = ()
+        self.receiver_callbacks = ()
+        # Called once per scheduling pass with every message sent in it
+        self.sender_batch_callbacks = ()
+        self.receiver_batch_callbacks = ()
+        # Batches handed from the scheduler to the dispatcher thread, so slow
+        # callbacks can't delay the next send; None tells the dispatcher to exit.
+        # Each start() makes a new one, so a run never sees another run's None
+        self._out_queue = queue.SimpleQueue()
         self.logger = logging.getLogger("CANSimulator")
         
         # Get message definitions from DBC
@@ -36,13 +105,19 @@ class DualCANSimulator:
         if not self.message_ids:
             self.logger.warning("No message definitions found in DBC!")
         
-        # Set up signal generators for realistic trends
+        # Set up signal generators for realistic trends, keyed by (msg_id, signal name)
         self.signal_generators = {}
+        # msg_id -> (((signal name, generator), ...), is_extended_id), so a send
+        # doesn't go back to the DBC for the message and its signals
+        self._msg_plan = {}
         self.setup_signal_generators()
         
         # Configure message frequencies (real-world behavior)
         self.message_frequencies = {}
-        self.message_last_sent = {}
+        # Min-heap of (next send time, msg_id, period), both in monotonic
+        # nanoseconds, so each wakeup only touches due messages and rescheduling
+        # needs no frequency lookup
+        self._schedule = []
         self.setup_message_frequencies()
     
     def setup_signal_generators(self):
@@ -51,26 +126,31 @@ class DualCANSimulator:
             message = self.dbc.get_message_by_id(msg_id)
             if not message:
                 continue
-                
+            
+            signal_entries = []
             for signal in message.signals:
                 # Set default min/max if not specified
                 min_val = signal.minimum if signal.minimum is not None else 0
                 max_val = signal.maximum if signal.maximum is not None else 100
                 
                 # Adjust min/max for common types
-                if 'temp' in signal.name.lower():
+                name = signal.name.lower()
+                if 'temp' in name:
                     # Temperature typically 0-100°C
                     min_val = max(min_val, 0)
                     max_val = min(max_val, 100)
-                elif 'rpm' in signal.name.lower():
+                elif 'rpm' in name:
                     # Engine RPM typically 0-8000
                     min_val = max(min_val, 0)
                     max_val = min(max_val, 8000)
                 
                 # Create trend generator
                 volatility = (max_val - min_val) * 0.01  # 1% of range
-                key = f"{msg_id}_{signal.name}"
+                key = (msg_id, signal.name)
                 self.signal_generators[key] = TrendGenerator(min_val, max_val, volatility)
+                signal_entries.append((signal.name, self.signal_generators[key]))
+            
+            self._msg_plan[msg_id] = (tuple(signal_entries), msg_id > 0x7FF)
     
     def setup_message_frequencies(self):
         """Set realistic frequencies for different message types"""
@@ -80,114 +160,179 @@ class DualCANSimulator:
                 continue
             
             # Set frequency based on message name/content (common patterns)
-            if 'engine' in message.name.lower():
-                # Engine data typically 10-100ms
-                self.message_frequencies[msg_id] = 0.01  # 10ms
-            elif 'temperature' in message.name.lower():
-                # Temperature data typically 500-1000ms
-                self.message_frequencies[msg_id] = 0.5  # 500ms
-            elif 'status' in message.name.lower():
-                # Status messages typically 1000ms
-                self.message_frequencies[msg_id] = 1.0  # 1000ms
-            else:
-                # Default to 100ms for other messages
-                self.message_frequencies[msg_id] = 0.1  # 100ms
-            
-            # Initialize last sent time
-            self.message_last_sent[msg_id] = 0
+            categories = _CAT_RE.findall(message.name.lower())
+            self.message_frequencies[msg_id] = (
+                min(_FREQ[c] for c in categories) if categories else DEFAULT_PERIOD)
+        
+        # Every message is due as soon as the simulation starts
+        self._schedule = [(0, msg_id, round(period * 1e9))
+                          for msg_id, period in self.message_frequencies.items()]
+        heapq.heapify(self._schedule)
+    
+    @property
+    def running(self):
+        """True while the simulation thread should keep sending"""
+        return not self._stop_event.is_set()
     
     def start(self):
         """Start the simulation"""
         if self.running:
             return
             
-        self.running = True
+        # A previous run's scheduler has already been told to stop; let it
+        # finish its pass so two loops never share the schedule
+        previous = getattr(self, 'simulation_thread', None)
+        if previous is not None:
+            previous.join()
+        
+        stop_event = self._stop_event = threading.Event()
+        out_queue = self._out_queue = queue.SimpleQueue()
         self.logger.info("Starting CAN simulator")
         
         # Start the simulation thread
         self.simulation_thread = threading.Thread(
             target=self._simulation_loop,
+            args=(stop_event, out_queue),
             daemon=True
         )
         self.simulation_thread.start()
+        
+        # Start the callback dispatcher thread
+        self.dispatcher_thread = threading.Thread(
+            target=self._dispatcher_loop,
+            args=(out_queue,),
+            daemon=True
+        )
+        self.dispatcher_thread.start()
     
     def stop(self):
         """Stop the simulation"""
-        self.running = False
+        if not self.running:
+            return
+        
+        self._stop_event.set()
+        self._out_queue.put(None)
         self.logger.info("Stopping CAN simulator")
     
-    def _simulation_loop(self):
+    def _simulation_loop(self, stop_event, out_queue):
         """Main simulation loop"""
-        last_cycle_time = time.time()
+        schedule = self._schedule
+        if not schedule:
+            return
+        
+        # Scheduling runs on the monotonic clock (immune to wall-clock steps);
+        # message timestamps are converted back to wall-clock time
+        wall_offset = time.time() - time.monotonic()
         
-        while self.running:
-            current_time = time.time()
+        while not stop_event.is_set():
+            now_ns = time.monotonic_ns()
             
-            # Process each message that's due to be sent
-            for msg_id in self.message_ids:
-                # Check if it's time to send this message
-                if (current_time - self.message_last_sent.get(msg_id, 0) >= 
-                    self.message_frequencies.get(msg_id, 0.1)):
-                    
-                    # Send the message
-                    self._send_simulated_message(msg_id)
-                    # Update last sent time
-                    self.message_last_sent[msg_id] = current_time
+            # Block until the next message is due, or until stop() is called
+            if schedule[0][0] > now_ns:
+                stop_event.wait((schedule[0][0] - now_ns) * 1e-9)
+                continue
             
-            # Sleep to maintain consistent cycle time
-            elapsed = time.time() - last_cycle_time
-            sleep_time = max(0.001, 0.01 - elapsed)  # Ensure at least 1ms sleep
-            time.sleep(sleep_time)
-            last_cycle_time = time.time()
-    
-    def _send_simulated_message(self, msg_id):
-        """Create and send a simulated message"""
-        # Get message definition
-        message = self.dbc.get_message_by_id(msg_id)
-        if not message:
-            return
+            # Build every message that is due, then hand them out as one batch
+            timestamp = now_ns * 1e-9 + wall_offset
+            batch = []
+            while schedule[0][0] <= now_ns:
+                deadline, msg_id, period = schedule[0]
+                
+                # Reschedule from the deadline to avoid drift, but don't try to
+                # catch up on sends missed while the loop was stalled or stopped
+                next_deadline = deadline + period
+                if next_deadline <= now_ns:
+                    next_deadline = now_ns + period
+                heapq.heapreplace(schedule, (next_deadline, msg_id, period))
+                
+                can_msg = self._create_simulated_message(msg_id, timestamp)
+                if can_msg is not None:
+                    batch.append(can_msg)
+            
+            if batch:
+                out_queue.put(batch)
+    
+    def _dispatcher_loop(self, out_queue):
+        """Deliver queued batches to the callbacks until stop() is called"""
+        while True:
+            batch = out_queue.get()
+            if batch is None:
+                break
+            self._dispatch_batch(batch)
+    
+    def _create_simulated_message(self, msg_id, timestamp):
+        """Create a simulated message, or None if it can't be encoded"""
+        # Get the precomputed send plan for this message
+        plan = self._msg_plan.get(msg_id)
+        if plan is None:
+            return None
+        signal_entries, is_extended = plan
         
         # Create a dictionary of signal values
-        signal_values = {}
-        for signal in message.signals:
-            key = f"{msg_id}_{signal.name}"
-            if key in self.signal_generators:
-                signal_values[signal.name] = self.signal_generators[key].next_value()
-            else:
-                # Fallback to random value if no generator exists
-                min_val = signal.minimum if signal.minimum is not None else 0
-                max_val = signal.maximum if signal.maximum is not None else 100
-                signal_values[signal.name] = random.uniform(min_val, max_val)
+        signal_values = {name: generator.next_value() for name, generator in signal_entries}
         
         try:
             # Encode the message
             data = self.dbc.encode_message(msg_id, signal_values)
+            if data is None:
+                # encode_message has already logged why
+                return None
             
-            # Create CAN message
-            can_msg = can.Message(
+            # Create CAN message; each one is owned by the dispatcher once queued
+            return can.Message(
+                timestamp=timestamp,
                 arbitration_id=msg_id,
                 data=data,
-                is_extended_id=(msg_id > 0x7FF)
+                is_extended_id=is_extended
             )
-            
+        except Exception as e:
+            self.logger.error(f"Error simulating message 0x{msg_id:X}: {e}")
+            return None
+    
+    def _dispatch_batch(self, batch):
+        """Notify sender then receiver callbacks of a batch of messages"""
+        try:
             # Notify sender callbacks
+            for callback in self.sender_batch_callbacks:
+                callback(batch, "sender")
             for callback in self.sender_callbacks:
-                callback(can_msg, "sender")
+                for can_msg in batch:
+                    callback(can_msg, "sender")
+            
+            if not (self.receiver_batch_callbacks or self.receiver_callbacks):
+                return
             
-            # Small delay to simulate transmission time
-            time.sleep(0.001)
+            # Model transmission time on the timestamps instead of sleeping, so
+            # the scheduler thread is never blocked by it; the receiver gets its
+            # own copies so messages the sender side kept are left unchanged
+            received = []
+            for can_msg in batch:
+                rx_msg = copy.copy(can_msg)
+                rx_msg.timestamp += SIMULATED_TX_DELAY
+                received.append(rx_msg)
             
             # Notify receiver callbacks
+            for callback in self.receiver_batch_callbacks:
+                callback(received, "receiver")
             for callback in self.receiver_callbacks:
-                callback(can_msg, "receiver")
+                for can_msg in received:
+                    callback(can_msg, "receiver")
             
         except Exception as e:
-            self.logger.error(f"Error simulating message 0x{msg_id:X}: {e}")
+            self.logger.error(f"Error dispatching simulated messages: {e}")
     
     def add_sender_callback(self, callback):
         """Add callback for sender-side messages"""
-        self.sender_callbacks.append(callback)
+        self.sender_callbacks += (callback,)
     
     def add_receiver_callback(self, callback):
         """Add callback for receiver-side messages"""
-        self.receiver_callbacks.append(callback)
\ No newline at end of file
+        self.receiver_callbacks += (callback,)
+    
+    def add_sender_batch_callback(self, callback):
+        """Add callback for sender-side batches: callback(messages, "sender")"""
+        self.sender_batch_callbacks += (callback,)
+    
+    def add_receiver_batch_callback(self, callback):
+        """Add callback for receiver-side batches: callback(messages, "receiver")"""
+        self.receiver_batch_callbacks += (callback,)
\ No newline at end of file
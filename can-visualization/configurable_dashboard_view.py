@@ -1,19 +1,18 @@
 import os
 import random
-import json
 import logging
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-                            QDialog, QTreeWidget, QTreeWidgetItem, QCheckBox, 
-                            QComboBox, QSpinBox, QGroupBox, QFormLayout, QDialogButtonBox)
-from PyQt5.QtCore import QUrl, QTimer, Qt
-from PyQt5.QtGui import QFontDatabase, QFont
+                            QDialog, QTreeView, QComboBox, QFormLayout, QDialogButtonBox)
+from PyQt5.QtCore import (QUrl, QTimer, Qt, QObject, QAbstractTableModel, QModelIndex,
+                          QRunnable, QThreadPool, QFile, QIODevice, pyqtSignal, pyqtSlot)
+from json_wrapper import dumps
 
 # Use the compatibility wrapper instead of direct imports
 try:
     from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings, QWebEngineScript
+    from PyQt5.QtWebChannel import QWebChannel
     HAS_WEBENGINE = True
 except ImportError:
-    from PyQt5.QtWidgets import QLabel
     HAS_WEBENGINE = False
     
     # Create stub classes
@@ -28,6 +27,54 @@ except ImportError:
     class QWebEngineScript:
         pass
 
+# Placeholder for signals not yet sent to the page; never equal to a value
+_UNSENT = object()
+
+# Static dashboard page, shipped next to this module
+DASHBOARD_HTML_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configurable_dashboard.html")
+
+# Selector tree rows for the most recently shown signal catalog; load_dbc builds
+# a new catalog list, so an identity check is enough to spot a reload
+_tree_rows_cache = (None, ())
+
+def _signal_tree_rows(catalog):
+    """Return (column labels, catalog entry) pairs sorted by message name, reused
+    while the catalog is unchanged"""
+    global _tree_rows_cache
+    cached_catalog, rows = _tree_rows_cache
+    if cached_catalog is not catalog:
+        rows = tuple(sorted(
+            (((entry['signal_name'], entry['message_name'], f"0x{entry['message_id']:X}"), entry)
+             for entry in catalog),
+            key=lambda row: row[0][1]
+        ))
+        _tree_rows_cache = (catalog, rows)
+    return rows
+
+class SignalTableModel(QAbstractTableModel):
+    """Read-only model over selector tree rows; Qt only asks for visible cells"""
+    HEADERS = ("Signal", "Message", "ID")
+    
+    def __init__(self, rows=(), parent=None):
+        super().__init__(parent)
+        self.rows = rows
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self.rows[index.row()][0][index.column()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
 class SignalSelectorDialog(QDialog):
     """Dialog for selecting CAN signals to display in the dashboard"""
     
@@ -43,9 +90,13 @@ class SignalSelectorDialog(QDialog):
         layout = QVBoxLayout(self)
         
         # Signal tree
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Signal", "Message", "ID"])
-        self.tree.setSelectionMode(QTreeWidget.ExtendedSelection)
+        self.model = SignalTableModel(parent=self)
+        self.tree = QTreeView()
+        self.tree.setRootIsDecorated(False)
+        # Lets the view skip measuring every row of a large DBC
+        self.tree.setUniformRowHeights(True)
+        self.tree.setSelectionMode(QTreeView.ExtendedSelection)
+        self.tree.setModel(self.model)
         layout.addWidget(self.tree)
         
         # Visualization type
@@ -75,48 +126,74 @@ class SignalSelectorDialog(QDialog):
         """Populate the tree with signals from the DBC file"""
         if not self.dbc_parser or not self.dbc_parser.db:
             return
-            
-        # Get all messages
-        message_ids = self.dbc_parser.get_all_message_ids()
-        for msg_id in message_ids:
-            message = self.dbc_parser.get_message_by_id(msg_id)
-            if not message:
-                continue
-                
-            # Add signals from this message
-            for signal in message.signals:
-                item = QTreeWidgetItem([
-                    signal.name,
-                    message.name,
-                    f"0x{msg_id:X}"
-                ])
-                # Store message ID and signal name as data
-                item.setData(0, Qt.UserRole, {
-                    'message_id': msg_id,
-                    'message_name': message.name,
-                    'signal_name': signal.name,
-                    'unit': signal.unit or ""
-                })
-                self.tree.addTopLevelItem(item)
-        
-        # Sort by message name
-        self.tree.sortItems(1, Qt.AscendingOrder)
+        
+        # Catalog is precomputed when the DBC is loaded, rows on first open
+        self.model.beginResetModel()
+        self.model.rows = _signal_tree_rows(self.dbc_parser.get_signal_catalog())
+        self.model.endResetModel()
     
     def get_selected_signals(self):
         """Get the selected signals and visualization settings"""
-        selected_items = self.tree.selectedItems()
         signals = []
         
-        for item in selected_items:
-            signal_data = item.data(0, Qt.UserRole)
-            if signal_data:
-                signal_data['viz_type'] = self.viz_type.currentText()
-                signal_data['widget_size'] = self.widget_size.currentText()
-                signals.append(signal_data)
+        for index in self.tree.selectionModel().selectedRows():
+            # Copy the catalog entry before adding visualization settings to it
+            signal_data = dict(self.model.rows[index.row()][1])
+            signal_data['viz_type'] = self.viz_type.currentText()
+            signal_data['widget_size'] = self.widget_size.currentText()
+            signals.append(signal_data)
                 
         return signals
 
 
+class DashboardBridge(QObject):
+    """QWebChannel object through which the dashboard page and Python talk"""
+    # JSON text pushed to the page's updateData/updateConfig
+    dataReady = pyqtSignal(str)
+    configReady = pyqtSignal(str)
+    # Re-emitted from the page's slot calls on the GUI thread
+    pageReady = pyqtSignal()
+    dataHandled = pyqtSignal()
+    widgetRemoved = pyqtSignal(str)
+    
+    @pyqtSlot()
+    def ready(self):
+        """Called by the page once its channel is connected"""
+        self.pageReady.emit()
+    
+    @pyqtSlot()
+    def dataApplied(self):
+        """Called by the page after it has processed a dataReady payload"""
+        self.dataHandled.emit()
+    
+    @pyqtSlot(str)
+    def removeWidget(self, widget_id):
+        """Called by the page when a widget's close button is clicked"""
+        self.widgetRemoved.emit(widget_id)
+
+
+class _SerializeSink(QObject):
+    """Carries JSON text serialized on a pool thread back to the GUI thread"""
+    done = pyqtSignal(str, object)  # JSON text, payload it was made from
+    failed = pyqtSignal()
+
+
+class _SerializeJob(QRunnable):
+    """Serializes one dashboard payload off the GUI thread"""
+    
+    def __init__(self, payload, sink):
+        super().__init__()
+        self.payload = payload
+        self.sink = sink
+    
+    def run(self):
+        try:
+            self.sink.done.emit(dumps(self.payload), self.payload)
+        except Exception as e:
+            logging.getLogger("ConfigurableDashboardView").error(f"Error serializing dashboard data: {e}")
+            self.sink.failed.emit()
+
+
 class ConfigurableDashboardView(QWidget):
     """Configurable dashboard view for CAN visualization"""
     
@@ -130,14 +207,39 @@ class ConfigurableDashboardView(QWidget):
         # Store messages and configured widgets
         self.recent_messages = {}
         self.configured_widgets = []
+        # Set when configured_widgets changes, so the config is only pushed to
+        # the page with the next update after an edit
+        self._config_dirty = True
+        # Derived from configured_widgets by _reindex_widgets: message name ->
+        # names of its signals shown by at least one widget, and the config JSON
+        self._needed = {}
+        self._config_json = dumps({"widgets": []})
+        # (message name, signal name) -> last value sent to the page, recorded
+        # once its payload has been serialized and handed over
+        self._last_sent = {}
+        # True from handing a payload to the serializer until the page reports
+        # it applied it; no new payload is started in between
+        self._in_flight = False
+        
+        # Data payloads are serialized on a single pool thread, so they reach
+        # the page in order, and delivered back here on the GUI thread
+        self._serialize_pool = QThreadPool(self)
+        self._serialize_pool.setMaxThreadCount(1)
+        self._serialize_sink = _SerializeSink(self)
+        self._serialize_sink.done.connect(self.on_payload_serialized)
+        # Nothing reaches the page, so don't wait for it to answer
+        self._serialize_sink.failed.connect(self.on_data_handled)
         
         # Initialize UI
         self.init_ui()
         
-        # Start update timer
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_dashboard)
-        self.update_timer.start(200)  # Update 5 times per second
+        # Single-shot flush timer armed by the first message after a flush, so
+        # an idle bus costs nothing and a busy one updates at most 5 times per second
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        # A UI refresh doesn't need millisecond accuracy; let Qt batch wakeups
+        self._flush_timer.setTimerType(Qt.CoarseTimer)
+        self._flush_timer.timeout.connect(self.update_dashboard)
     
     def init_ui(self):
         """Initialize the user interface"""
@@ -174,523 +276,107 @@ class ConfigurableDashboardView(QWidget):
         # Enable JavaScript
         self.web_view.settings().setAttribute(QWebEngineSettings.JavascriptEnabled, True)
         
-        # Load the HTML content directly
-        html_content = self.get_dashboard_html()
-        self.web_view.setHtml(html_content)
+        # Expose the bridge to the page as "dashboard"
+        self.bridge = DashboardBridge(self)
+        self.bridge.pageReady.connect(self.on_page_ready)
+        self.bridge.dataHandled.connect(self.on_data_handled)
+        self.bridge.widgetRemoved.connect(self.on_widget_removed)
+        self.channel = QWebChannel(self.web_view.page())
+        self.channel.registerObject("dashboard", self.bridge)
+        self.web_view.page().setWebChannel(self.channel)
+        self.install_bridge_script()
         
-        # Connect to the page created signal to inject the JavaScript bridge
+        # Load the static page from disk so Chromium can cache it
+        self.web_view.setUrl(QUrl.fromLocalFile(DASHBOARD_HTML_PATH))
+        
+        # Report whether the page loaded
         self.web_view.loadFinished.connect(self.on_load_finished)
         
         layout.addWidget(self.web_view)
     
-    def on_load_finished(self, ok):
-        """Handle the web page finished loading"""
-        if ok:
-            self.logger.info("Dashboard page loaded successfully")
-            
-            # Inject JavaScript to handle direct data injection
-            script = """
-            // Store the received data globally
-            var dashboardData = {};
-            var dashboardConfig = { widgets: [] };
+    def install_bridge_script(self):
+        """Have the page run the bridge script itself as soon as its DOM is ready"""
+        # qwebchannel.js ships as a Qt resource with QtWebEngine
+        channel_js = QFile(":/qtwebchannel/qwebchannel.js")
+        if not channel_js.open(QIODevice.ReadOnly):
+            self.logger.error("Could not load qwebchannel.js - dashboard will not update")
+            return
+        channel_script = bytes(channel_js.readAll()).decode("utf-8")
+        channel_js.close()
+        
+        # Receive data and config through the channel
+        script = """
+        // Store the received data globally
+        var dashboardData = {};
+        var dashboardConfig = { widgets: [] };
+        
+        // Function to be called from Python
+        function updateData(data) {
+            // Parse the JSON data
+            var jsonData = JSON.parse(data);
+            dashboardData = jsonData;
             
-            // Function to be called from Python
-            function updateData(data) {
-                // Parse the JSON data
-                var jsonData = JSON.parse(data);
-                dashboardData = jsonData;
-                
+            try {
                 // Process the data updates
                 if (typeof updateWidgets === 'function') {
                     updateWidgets(dashboardData);
                 }
-            }
-            
-            // Function to update dashboard configuration
-            function updateConfig(config) {
-                // Parse the JSON config
-                var jsonConfig = JSON.parse(config);
-                dashboardConfig = jsonConfig;
-                
-                // Update the dashboard configuration
-                if (typeof updateDashboardConfig === 'function') {
-                    updateDashboardConfig(dashboardConfig.widgets);
+            } finally {
+                // Let Python send the next payload
+                if (dashboardBridge) {
+                    dashboardBridge.dataApplied();
                 }
             }
-            
-            // Function to notify Python when a widget is removed
-            function removeWidgetPython(widgetId) {
-                // This will be replaced by QWebChannel
-                console.log("Widget removed: " + widgetId);
-                
-                // Remove widget from our config
-                dashboardConfig.widgets = dashboardConfig.widgets.filter(w => w.id !== widgetId);
-            }
-            """
-            
-            # Run the script
-            self.web_view.page().runJavaScript(script)
-        else:
-            self.logger.error("Failed to load dashboard page")
-    
-    def get_dashboard_html(self):
-        """Get the HTML content for the dashboard"""
-        return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>CAN Dashboard</title>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/Chart.js/3.7.0/chart.min.js"></script>
-    <style>
-        body, html {
-            margin: 0;
-            padding: 0;
-            font-family: Arial, sans-serif;
-            height: 100%;
-            background-color: #f0f2f5;
-        }
-        
-        #app {
-            height: 100%;
-            display: flex;
-            flex-direction: column;
-        }
-        
-        .header {
-            background-color: #1e3a8a;
-            color: white;
-            padding: 10px 20px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .content {
-            flex: 1;
-            padding: 20px;
-            overflow: auto;
-        }
-        
-        .dashboard {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-            margin-bottom: 20px;
-        }
-        
-        .empty-dashboard {
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-            height: 400px;
-            color: #666;
-            border: 2px dashed #ccc;
-            border-radius: 8px;
-            text-align: center;
-            padding: 20px;
-        }
-        
-        .empty-dashboard h3 {
-            margin-bottom: 10px;
-        }
-        
-        .widget {
-            background: white;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.05);
-            padding: 15px;
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .widget-title {
-            font-size: 14px;
-            color: #666;
-            margin-bottom: 5px;
-            display: flex;
-            justify-content: space-between;
-        }
-        
-        .widget-title .widget-close {
-            cursor: pointer;
-            color: #999;
-            font-size: 16px;
-        }
-        
-        .widget-title .widget-close:hover {
-            color: #f44336;
         }
         
-        .widget-value {
-            font-size: 28px;
-            font-weight: bold;
-        }
-        
-        .widget-unit {
-            font-size: 14px;
-            color: #999;
-            margin-left: 5px;
-        }
-        
-        .chart-container {
-            height: 80px;
-            margin-top: 10px;
-            position: relative;
-        }
-        
-        .gauge-container {
-            height: 130px;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-        }
-        
-        .gauge {
-            width: 120px;
-            height: 120px;
-            position: relative;
-        }
-        
-        .gauge-background {
-            width: 100%;
-            height: 100%;
-            border-radius: 50%;
-            background: #e0e0e0;
-            position: absolute;
-            clip-path: polygon(50% 0%, 100% 0%, 100% 100%, 50% 100%);
-            transform: rotate(0deg);
-        }
-        
-        .gauge-progress {
-            width: 100%;
-            height: 100%;
-            border-radius: 50%;
-            background: linear-gradient(to right, #4CAF50, #FFEB3B, #FF5722);
-            position: absolute;
-            clip-path: polygon(50% 0%, 100% 0%, 100% 100%, 50% 100%);
-            transform-origin: center left;
-        }
-        
-        .gauge-center {
-            position: absolute;
-            width: 80%;
-            height: 80%;
-            background: white;
-            border-radius: 50%;
-            top: 10%;
-            left: 10%;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            flex-direction: column;
-        }
-        
-        .gauge-value {
-            font-size: 24px;
-            font-weight: bold;
-        }
-        
-        .gauge-label {
-            font-size: 12px;
-            color: #666;
-        }
-        
-        .widget.small {
-            grid-column: span 1;
-        }
-        
-        .widget.medium {
-            grid-column: span 2;
-        }
-        
-        .widget.large {
-            grid-column: span 3;
-        }
-        
-        @media (max-width: 768px) {
-            .widget.medium, .widget.large {
-                grid-column: span 1;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div id="app">
-        <div class="header">
-            <h2>CAN Visualization Dashboard</h2>
-            <div id="status">Ready</div>
-        </div>
-        
-        <div class="content">
-            <div id="dashboard" class="dashboard">
-                <div id="empty-dashboard" class="empty-dashboard">
-                    <h3>No Widgets Added</h3>
-                    <p>Add widgets using the "Add Widget" button above</p>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        // Track widgets and data
-        const widgets = {};
-        const dataHistory = {};
-                
-        // Update dashboard configuration (add/remove widgets)
-        function updateDashboardConfig(widgetConfigs) {
-            // Hide empty dashboard message if we have widgets
-            if (widgetConfigs.length > 0) {
-                document.getElementById('empty-dashboard').style.display = 'none';
-            } else {
-                document.getElementById('empty-dashboard').style.display = 'flex';
-            }
-            
-            // First, remove any widgets that are no longer in the config
-            const currentWidgetIds = Object.keys(widgets);
-            const newWidgetIds = widgetConfigs.map(w => w.id);
-            
-            for (const widgetId of currentWidgetIds) {
-                if (!newWidgetIds.includes(widgetId)) {
-                    // Remove the widget
-                    const element = document.getElementById(`widget-${widgetId}`);
-                    if (element) {
-                        element.remove();
-                    }
-                    delete widgets[widgetId];
-                    delete dataHistory[widgetId];
-                }
-            }
+        // Function to update dashboard configuration
+        function updateConfig(config) {
+            // Parse the JSON config
+            var jsonConfig = JSON.parse(config);
+            dashboardConfig = jsonConfig;
             
-            // Add or update widgets
-            for (const widgetConfig of widgetConfigs) {
-                if (!widgets[widgetConfig.id]) {
-                    // Add new widget
-                    addWidget(widgetConfig);
-                }
+            // Update the dashboard configuration
+            if (typeof updateDashboardConfig === 'function') {
+                updateDashboardConfig(dashboardConfig.widgets);
             }
         }
         
-        // Add a new widget to the dashboard
-        function addWidget(config) {
-            const dashboard = document.getElementById('dashboard');
+        // Function to notify Python when a widget is removed
+        function removeWidgetPython(widgetId) {
+            // Remove widget from our config
+            dashboardConfig.widgets = dashboardConfig.widgets.filter(w => w.id !== widgetId);
             
-            // Create widget element
-            const widget = document.createElement('div');
-            widget.id = `widget-${config.id}`;
-            widget.className = `widget ${config.size.toLowerCase()}`;
-            
-            // Set up data history
-            dataHistory[config.id] = {
-                values: Array(60).fill(0),
-                chart: null
-            };
-            
-            // Create widget content based on type
-            if (config.type === 'Gauge') {
-                widget.innerHTML = `
-                    <div class="widget-title">
-                        <span>${config.signal} (${config.message})</span>
-                        <span class="widget-close" onclick="removeWidget('${config.id}')">&times;</span>
-                    </div>
-                    <div class="gauge-container">
-                        <div class="gauge">
-                            <div class="gauge-background"></div>
-                            <div class="gauge-progress" id="gauge-${config.id}" style="transform: rotate(-90deg);"></div>
-                            <div class="gauge-center">
-                                <div class="gauge-value" id="value-${config.id}">0</div>
-                                <div class="gauge-label">${config.unit || ''}</div>
-                            </div>
-                        </div>
-                    </div>
-                `;
-            } else if (config.type === 'Line Chart') {
-                widget.innerHTML = `
-                    <div class="widget-title">
-                        <span>${config.signal} (${config.message})</span>
-                        <span class="widget-close" onclick="removeWidget('${config.id}')">&times;</span>
-                    </div>
-                    <div class="chart-container">
-                        <canvas id="chart-${config.id}"></canvas>
-                    </div>
-                `;
-            } else {
-                // Numeric display
-                widget.innerHTML = `
-                    <div class="widget-title">
-                        <span>${config.signal} (${config.message})</span>
-                        <span class="widget-close" onclick="removeWidget('${config.id}')">&times;</span>
-                    </div>
-                    <div class="widget-value" id="value-${config.id}">0</div>
-                    <div class="widget-unit">${config.unit || ''}</div>
-                `;
-            }
-            
-            dashboard.appendChild(widget);
-            
-            // Initialize chart if needed
-            if (config.type === 'Line Chart') {
-                const ctx = document.getElementById(`chart-${config.id}`).getContext('2d');
-                dataHistory[config.id].chart = new Chart(ctx, {
-                    type: 'line',
-                    data: {
-                        labels: Array(20).fill(''),
-                        datasets: [{
-                            data: dataHistory[config.id].values.slice(-20),
-                            borderColor: '#4a90e2',
-                            backgroundColor: 'rgba(74, 144, 226, 0.1)',
-                            borderWidth: 2,
-                            fill: true,
-                            pointRadius: 0
-                        }]
-                    },
-                    options: {
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        scales: {
-                            x: {
-                                display: false
-                            },
-                            y: {
-                                display: true,
-                                beginAtZero: false
-                            }
-                        },
-                        plugins: {
-                            legend: {
-                                display: false
-                            },
-                            tooltip: {
-                                enabled: false
-                            }
-                        },
-                        elements: {
-                            line: {
-                                tension: 0.4
-                            }
-                        },
-                        animation: false
-                    }
-                });
-            }
-            
-            // Store widget config
-            widgets[config.id] = config;
-        }
-        
-        // Remove a widget (called from widget close button)
-        function removeWidget(widgetId) {
-            // Send message to parent window
-            if (typeof removeWidgetPython === 'function') {
-                removeWidgetPython(widgetId);
-            }
-            
-            // Remove widget from DOM
-            const element = document.getElementById(`widget-${widgetId}`);
-            if (element) {
-                element.remove();
-            }
-            
-            // Clean up data
-            delete widgets[widgetId];
-            delete dataHistory[widgetId];
-            
-            // Show empty dashboard if no widgets left
-            if (Object.keys(widgets).length === 0) {
-                document.getElementById('empty-dashboard').style.display = 'flex';
-            }
-        }
-        
-        // Update gauges and charts with new data
-        function updateWidgets(data) {
-            // Update each widget with matching data
-            for (const widgetId in widgets) {
-                const widget = widgets[widgetId];
-                const messageName = widget.message;
-                const signalName = widget.signal;
-                
-                // Find the value for this widget
-                if (data[messageName] && data[messageName][signalName] !== undefined) {
-                    const value = data[messageName][signalName];
-                    
-                    // Update data history
-                    dataHistory[widgetId].values.push(value);
-                    dataHistory[widgetId].values.shift();
-                    
-                    // Update widget based on type
-                    if (widget.type === 'Gauge') {
-                        updateGauge(widgetId, value);
-                    } else if (widget.type === 'Line Chart') {
-                        updateChart(widgetId, value);
-                    } else {
-                        // Numeric display
-                        updateNumeric(widgetId, value);
-                    }
-                }
-            }
-        }
-        
-        // Update gauge widget
-        function updateGauge(widgetId, value) {
-            // Update value text
-            const valueElement = document.getElementById(`value-${widgetId}`);
-            if (valueElement) {
-                valueElement.textContent = typeof value === 'number' ? 
-                    value.toFixed(value < 10 ? 1 : 0) : value;
-            }
-            
-            // Update gauge position
-            const gaugeElement = document.getElementById(`gauge-${widgetId}`);
-            if (gaugeElement) {
-                // Estimate min/max from recent values
-                const values = dataHistory[widgetId].values.filter(v => v !== 0);
-                const min = values.length > 0 ? Math.min(...values) : 0;
-                const max = values.length > 0 ? Math.max(...values) : 100;
-                const buffer = (max - min) * 0.1; // Add 10% buffer
-                
-                const percentage = (value - min) / (max - min + buffer);
-                const rotation = -90 + percentage * 180;
-                gaugeElement.style.transform = `rotate(${rotation}deg)`;
-                
-                // Update color based on value
-                let color;
-                if (percentage < 0.33) {
-                    color = '#4CAF50'; // Green
-                } else if (percentage < 0.66) {
-                    color = '#FFEB3B'; // Yellow
-                } else {
-                    color = '#FF5722'; // Red/Orange
-                }
-                gaugeElement.style.background = color;
-            }
-        }
-        
-        // Update chart widget
-        function updateChart(widgetId, value) {
-            const chart = dataHistory[widgetId].chart;
-            if (chart) {
-                chart.data.datasets[0].data = dataHistory[widgetId].values.slice(-20);
-                chart.update();
-            }
-        }
-        
-        // Update numeric display widget
-        function updateNumeric(widgetId, value) {
-            const valueElement = document.getElementById(`value-${widgetId}`);
-            if (valueElement) {
-                valueElement.textContent = typeof value === 'number' ? 
-                    value.toFixed(value < 10 ? 1 : 0) : value;
+            if (dashboardBridge) {
+                dashboardBridge.removeWidget(widgetId);
             }
         }
         
-        // Initialize
-        window.addEventListener('load', function() {
-            document.getElementById('status').textContent = 'Ready - Add widgets to begin';
+        // Connect to the Python bridge, then ask for the current config
+        var dashboardBridge = null;
+        new QWebChannel(qt.webChannelTransport, function(channel) {
+            dashboardBridge = channel.objects.dashboard;
+            dashboardBridge.dataReady.connect(updateData);
+            dashboardBridge.configReady.connect(updateConfig);
+            dashboardBridge.ready();
         });
-    </script>
-</body>
-</html>"""
+        """
+        
+        # Registered once, the script is injected into every (re)load of the
+        # page at DOMContentLoaded, without waiting for loadFinished
+        bridge_script = QWebEngineScript()
+        bridge_script.setName("dashboardBridge")
+        bridge_script.setSourceCode(channel_script + script)
+        bridge_script.setInjectionPoint(QWebEngineScript.DocumentReady)
+        bridge_script.setWorldId(QWebEngineScript.MainWorld)
+        bridge_script.setRunsOnSubFrames(False)
+        self.web_view.page().scripts().insert(bridge_script)
+    
+    def on_load_finished(self, ok):
+        """Handle the web page finished loading"""
+        if ok:
+            self.logger.info("Dashboard page loaded successfully")
+        else:
+            self.logger.error("Failed to load dashboard page")
     
     def init_web_channel(self, message_processor, dbc_parser):
         """Initialize with the message processor and DBC parser"""
@@ -702,38 +388,110 @@ class ConfigurableDashboardView(QWidget):
         
         self.status_label.setText("Dashboard Ready - Add Widgets to Begin")
     
+    def on_page_ready(self):
+        """Handle the page connecting to the bridge"""
+        # Updates sent before the page was listening were dropped, so resend
+        # the config now rather than waiting for the next message, and let every
+        # value through again
+        self._config_dirty = True
+        self._last_sent = {}
+        self._in_flight = False
+        self.update_dashboard()
+    
+    def on_data_handled(self):
+        """Handle the page finishing a payload"""
+        self._in_flight = False
+        
+        # Anything that arrived meanwhile goes out with the next flush
+        if (self.recent_messages or self._config_dirty) and not self._flush_timer.isActive():
+            self._flush_timer.start(200)
+    
+    def on_widget_removed(self, widget_id):
+        """Handle a widget being closed on the page"""
+        self.configured_widgets = [w for w in self.configured_widgets if w["id"] != widget_id]
+        self._reindex_widgets()
+        self.logger.info(f"Removed widget: {widget_id}")
+    
+    def _reindex_widgets(self):
+        """Recompute the needed signals and the config JSON from configured_widgets"""
+        self._needed = {}
+        for widget in self.configured_widgets:
+            self._needed.setdefault(widget["message"], set()).add(widget["signal"])
+        self._config_json = dumps({"widgets": self.configured_widgets})
+        # New widgets start without a value, so send everything again once
+        self._last_sent = {}
+    
     def on_message_decoded(self, frame_id, message_name, signals, interface):
         """Handle a decoded CAN message"""
+        # No widget shows this message, so don't store it or wake the page
+        if message_name not in self._needed:
+            return
+        
         # Store the message for the next update cycle
         self.recent_messages[message_name] = signals
-        self.logger.debug(f"Stored message for dashboard: {message_name}")
+        self.logger.debug("Stored message for dashboard: %s", message_name)
+        
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(200)
     
     def update_dashboard(self):
         """Update the dashboard with recent messages"""
-        if not self.recent_messages:
+        # The page is still busy with the previous payload; keep collecting
+        # messages, on_data_handled schedules the next flush
+        if self._in_flight:
+            return
+        
+        # Only send the signals a widget actually displays, and only when their
+        # value differs from what the page already has
+        last_sent = self._last_sent
+        payload = {}
+        for message_name, wanted in self._needed.items():
+            signals = self.recent_messages.get(message_name)
+            if not signals:
+                continue
+            changed = {}
+            for signal_name in wanted:
+                if signal_name in signals:
+                    value = signals[signal_name]
+                    key = (message_name, signal_name)
+                    if last_sent.get(key, _UNSENT) != value:
+                        changed[signal_name] = value
+            if changed:
+                payload[message_name] = changed
+        if not payload and not self._config_dirty:
+            self.recent_messages = {}
             return
             
         try:
-            # Send data to JavaScript
-            if hasattr(self, 'web_view'):
-                # Convert messages to JSON
-                data_json = json.dumps(self.recent_messages)
+            # Send data to JavaScript through the web channel
+            if hasattr(self, 'bridge'):
+                if payload:
+                    # The payload is a new dict of plain values, safe to hand over
+                    self._in_flight = True
+                    self._serialize_pool.start(_SerializeJob(payload, self._serialize_sink))
                 
-                # Inject data using JavaScript
-                js_code = f"updateData('{data_json.replace("'", "\\'")}');"
-                self.web_view.page().runJavaScript(js_code)
+                # Update widget configuration if needed
+                if self._config_dirty:
+                    self.bridge.configReady.emit(self._config_json)
                 
                 # Clear recent messages
                 self.recent_messages = {}
-                
-                # Update widget configuration if needed
-                config_json = json.dumps({"widgets": self.configured_widgets})
-                js_code = f"updateConfig('{config_json.replace("'", "\\'")}');"
-                self.web_view.page().runJavaScript(js_code)
+                self._config_dirty = False
             
         except Exception as e:
             self.logger.error(f"Error updating dashboard: {e}")
     
+    def on_payload_serialized(self, data_json, payload):
+        """Send a data payload serialized by _SerializeJob to the page"""
+        if hasattr(self, 'bridge'):
+            self.bridge.dataReady.emit(data_json)
+            # Only now does the page have these values; a failed payload
+            # leaves them unrecorded so the next update sends them again
+            last_sent = self._last_sent
+            for message_name, changed in payload.items():
+                for signal_name, value in changed.items():
+                    last_sent[(message_name, signal_name)] = value
+    
     def add_widget_dialog(self):
         """Show dialog to add a widget to the dashboard"""
         if not self.dbc_parser or not self.dbc_parser.db:
@@ -744,11 +502,28 @@ class ConfigurableDashboardView(QWidget):
         if dialog.exec_():
             selected_signals = dialog.get_selected_signals()
             if selected_signals:
+                # Append every widget first, then push the config to the page once
                 for signal in selected_signals:
-                    self.add_widget(signal)
+                    self._append_widget_config(signal)
+                
+                if len(selected_signals) == 1:
+                    self.status_label.setText(f"Added widget for {selected_signals[0]['signal_name']}")
+                else:
+                    self.status_label.setText(f"Added {len(selected_signals)} widgets")
+                self._widgets_changed()
     
     def add_widget(self, signal_config):
         """Add a widget to the dashboard"""
+        self._append_widget_config(signal_config)
+        
+        # Update status
+        self.status_label.setText(f"Added widget for {signal_config['signal_name']}")
+        
+        # Force update to dashboard
+        self._widgets_changed()
+    
+    def _append_widget_config(self, signal_config):
+        """Add a widget to configured_widgets without updating the dashboard"""
         widget_id = f"widget_{len(self.configured_widgets)}_{random.randint(1000, 9999)}"
         
         # Create widget configuration
@@ -764,16 +539,16 @@ class ConfigurableDashboardView(QWidget):
         # Add to configured widgets
         self.configured_widgets.append(widget_config)
         
-        # Update status
-        self.status_label.setText(f"Added widget for {signal_config['signal_name']}")
-        
-        # Force update to dashboard
-        self.update_dashboard()
-        
         self.logger.info(f"Added widget: {signal_config['signal_name']} (Type: {signal_config['viz_type']}, Size: {signal_config['widget_size']})")
     
+    def _widgets_changed(self):
+        """Push configured_widgets to the page after it was edited"""
+        self._reindex_widgets()
+        self._config_dirty = True
+        self.update_dashboard()
+    
     def clear_dashboard(self):
         """Clear all widgets from the dashboard"""
         self.configured_widgets = []
-        self.update_dashboard()
+        self._widgets_changed()
         self.status_label.setText("Dashboard cleared")
\ No newline at end of file
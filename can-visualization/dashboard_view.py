@@ -1,85 +1,31 @@
 import os
-import random
-import json
 import logging
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PyQt5.QtCore import QUrl, QTimer
+from PyQt5.QtCore import QUrl, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 
 # Use the compatibility wrapper instead of direct imports
-from webengine_wrapper import QWebEngineView, QWebEngineSettings, HAS_WEBENGINE
+from webengine_wrapper import QWebEngineView, QWebChannel, HAS_WEBENGINE
+from json_wrapper import dumps
 
-class DashboardView(QWidget):
-    """Modern dashboard view using web technologies for visualization"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.logger = logging.getLogger("DashboardView")
-        self.message_processor = None
-        self.dbc_parser = None
-        self.logger.info("Initializing dashboard view")
-        
-        # Store messages temporarily
-        self.recent_messages = {}
-        
-        # Initialize UI
-        self.init_ui()
-        
-        # Start update timer - instead of using QWebChannel, we'll use periodic updates
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_dashboard)
-        self.update_timer.start(200)  # Update 5 times per second
-        
-    def init_ui(self):
-        """Initialize the user interface"""
-        # Create layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        if not HAS_WEBENGINE:
-            # If web engine is not available, show a message
-            layout.addWidget(QLabel("PyQtWebEngine is not available. Please install it with: pip install PyQtWebEngine"))
-            self.logger.warning("PyQtWebEngine not available - dashboard functionality limited")
-            return
-        
-        # Create web view
-        self.web_view = QWebEngineView()
-        
-        # Create dashboard HTML file
-        html_path = self.create_dashboard_html()
-        if html_path:
-            self.logger.info(f"Loading dashboard HTML from: {html_path}")
-            self.web_view.load(QUrl.fromLocalFile(html_path))
-        else:
-            # Fallback message
-            layout.addWidget(QLabel("Failed to create dashboard. Check logs for details."))
-            self.logger.error("Failed to create dashboard HTML file")
-            
-        layout.addWidget(self.web_view)
-    
-    def create_dashboard_html(self):
-        """Create the dashboard HTML file"""
-        try:
-            html_content = self.get_dashboard_html()
-            file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashboard.html")
-            
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
-                
-            return file_path
-        except Exception as e:
-            self.logger.error(f"Error creating dashboard HTML: {e}")
-            return None
-    
-    def get_dashboard_html(self):
-        """Get the HTML content for the dashboard"""
-        # We'll use a simpler approach without QWebChannel
-        return """<!DOCTYPE html>
+# Message name -> signals the dashboard page reads from it (see processUpdates);
+# everything else is dropped before it is queued for the page
+PAGE_SIGNALS = {
+    'CCVS1': ('WheelBasedVehicleSpeed',),
+    'EEC1': ('EngineSpeed',),
+}
+
+# Dashboard page, loaded with setHtml; relative URLs in it resolve against
+# this module's directory
+DASHBOARD_BASE_URL = QUrl.fromLocalFile(os.path.dirname(os.path.abspath(__file__)) + os.sep)
+DASHBOARD_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>CAN Dashboard</title>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/Chart.js/3.7.0/chart.min.js"></script>
+    <!-- Chart.js is shipped with the app, so the page needs no network -->
+    <script src="vendor/chart.js"></script>
+    <script src="qrc:///qtwebchannel/qwebchannel.js"></script>
     <style>
         body, html {
             margin: 0;
@@ -162,24 +108,10 @@ class DashboardView(QWidget):
             position: relative;
         }
         
-        .gauge-background {
-            width: 100%;
-            height: 100%;
-            border-radius: 50%;
-            background: #e0e0e0;
+        .gauge-canvas {
             position: absolute;
-            clip-path: polygon(50% 0%, 100% 0%, 100% 100%, 50% 100%);
-            transform: rotate(0deg);
-        }
-        
-        .gauge-progress {
-            width: 100%;
-            height: 100%;
-            border-radius: 50%;
-            background: linear-gradient(to right, #4CAF50, #FFEB3B, #FF5722);
-            position: absolute;
-            clip-path: polygon(50% 0%, 100% 0%, 100% 100%, 50% 100%);
-            transform-origin: center left;
+            top: 0;
+            left: 0;
         }
         
         .gauge-center {
@@ -313,8 +245,7 @@ class DashboardView(QWidget):
                     <!-- Oil Temperature Gauge -->
                     <div class="gauge-container">
                         <div class="gauge">
-                            <div class="gauge-background"></div>
-                            <div class="gauge-progress" id="oil-temp-gauge" style="transform: rotate(0deg); background: #FFC107;"></div>
+                            <canvas class="gauge-canvas" id="oil-temp-gauge" width="120" height="120"></canvas>
                             <div class="gauge-center">
                                 <div class="gauge-value" id="oil-temp-value">101</div>
                                 <div class="gauge-label">oil</div>
@@ -325,8 +256,7 @@ class DashboardView(QWidget):
                     <!-- Fuel Temperature Gauge -->
                     <div class="gauge-container">
                         <div class="gauge">
-                            <div class="gauge-background"></div>
-                            <div class="gauge-progress" id="fuel-temp-gauge" style="transform: rotate(0deg); background: #2196F3;"></div>
+                            <canvas class="gauge-canvas" id="fuel-temp-gauge" width="120" height="120"></canvas>
                             <div class="gauge-center">
                                 <div class="gauge-value" id="fuel-temp-value">36</div>
                                 <div class="gauge-label">fuel</div>
@@ -337,8 +267,7 @@ class DashboardView(QWidget):
                     <!-- Coolant Temperature Gauge -->
                     <div class="gauge-container">
                         <div class="gauge">
-                            <div class="gauge-background"></div>
-                            <div class="gauge-progress" id="coolant-temp-gauge" style="transform: rotate(0deg); background: #4CAF50;"></div>
+                            <canvas class="gauge-canvas" id="coolant-temp-gauge" width="120" height="120"></canvas>
                             <div class="gauge-center">
                                 <div class="gauge-value" id="coolant-temp-value">90</div>
                                 <div class="gauge-label">coolant</div>
@@ -377,26 +306,51 @@ class DashboardView(QWidget):
     </div>
     
     <script>
+        // Chart data as fixed {x, y} points: with parsing disabled Chart.js reads
+        // them directly, so new samples are shifted through the y values in place
+        function makePoints(values) {
+            return values.map((y, x) => ({x, y}));
+        }
+        
+        function shiftPoints(points, value) {
+            const last = points.length - 1;
+            for (let i = 0; i < last; i++) {
+                points[i].y = points[i + 1].y;
+            }
+            points[last].y = value;
+        }
+        
+        // Points with whole-number values in [base, base + spread), built in one pass
+        function randomPoints(count, base, spread) {
+            const points = new Array(count);
+            for (let x = 0; x < count; x++) {
+                points[x] = {x, y: Math.floor(base + Math.random() * spread)};
+            }
+            return points;
+        }
+        
         // Data storage
         const dataHistory = {
             speed: {
-                values: Array(60).fill(0),
+                current: 50,
+                values: makePoints(Array(60).fill(0)),
                 chart: null
             },
             engineSpeed: {
-                values: Array(60).fill(0),
+                current: 1800,
+                values: makePoints(Array(60).fill(0)),
                 chart: null
             },
             fuelRate: {
-                values: Array(60).fill(0),
+                values: makePoints(Array(60).fill(0)),
                 chart: null
             },
             fuelEconomy: {
-                values: Array(60).fill(0),
+                values: makePoints(Array(60).fill(0)),
                 chart: null
             },
             powerLevel: {
-                values: Array(60).fill(0),
+                values: makePoints(Array(60).fill(0)),
                 chart: null
             },
             temperatures: {
@@ -406,46 +360,68 @@ class DashboardView(QWidget):
             },
             canMessage: {
                 labels: Array(60).fill(''),
-                cylinderTemp: Array(60).fill(0).map(() => Math.floor(35 + Math.random() * 15)),
-                sensorPressure: Array(60).fill(0).map(() => Math.floor(90 + Math.random() * 10)),
+                cylinderTemp: randomPoints(60, 35, 15),
+                sensorPressure: randomPoints(60, 90, 10),
                 chart: null
             },
             warningLamps: {
                 labels: Array(60).fill(''),
-                compressor: Array(60).fill(0),
-                engineWarning: Array(60).fill(0),
-                brakeActive: Array(60).fill(0),
+                compressor: makePoints(Array(60).fill(0)),
+                engineWarning: makePoints(Array(60).fill(0)),
+                brakeActive: makePoints(Array(60).fill(0)),
                 chart: null
             },
             fuelLevel: 51
         };
         
+        // Elements by id, looked up once on first use
+        const refs = {};
+        
+        function ref(id) {
+            return refs[id] || (refs[id] = document.getElementById(id));
+        }
+        
         // Initialize starting values
-        document.getElementById('speed-value').textContent = '50';
-        document.getElementById('engine-speed-value').textContent = '1800';
-        
-        // Polling for updates - no need for web channel
-        function pollForUpdates() {
-            fetch('dashboard-data.json')
-                .then(response => {
-                    if (response.ok) {
-                        return response.json();
-                    } else {
-                        // If file not found, continue with simulation
-                        simulateUpdates();
-                        return null;
-                    }
-                })
-                .then(data => {
-                    if (data) {
-                        processUpdates(data);
-                    }
-                })
-                .catch(error => {
-                    // On error, continue with simulation
-                    console.log('Using simulation mode:', error);
-                    simulateUpdates();
-                });
+        ref('speed-value').textContent = dataHistory.speed.current;
+        ref('engine-speed-value').textContent = dataHistory.engineSpeed.current;
+        
+        // Latest value of every signal pushed from Python, if any
+        let latestData = null;
+        
+        // Pushed from Python with the values changed since its last push
+        function receiveUpdates(json) {
+            const changes = JSON.parse(json);
+            latestData = latestData || {};
+            for (const name in changes) {
+                latestData[name] = Object.assign(latestData[name] || {}, changes[name]);
+            }
+        }
+        
+        // Pushed from Python with [minimum, maximum] of the page's signals from
+        // the DBC; fixed bounds let Chart.js skip fitting the y scale to the data
+        function applyAxisRanges(json) {
+            const ranges = JSON.parse(json);
+            const targets = [
+                [ranges.CCVS1 && ranges.CCVS1.WheelBasedVehicleSpeed, dataHistory.speedHistory],
+                [ranges.EEC1 && ranges.EEC1.EngineSpeed, dataHistory.engineSpeedHistory]
+            ];
+            for (const [range, chart] of targets) {
+                if (range && chart) {
+                    const y = chart.options.scales.y;
+                    y.min = range[0];
+                    y.max = range[1];
+                    markDirty(chart);
+                }
+            }
+        }
+        
+        // Refresh from the latest real data, or simulate until some arrives
+        function tick() {
+            if (latestData) {
+                processUpdates(latestData);
+            } else {
+                simulateUpdates();
+            }
         }
         
         function processUpdates(data) {
@@ -462,41 +438,74 @@ class DashboardView(QWidget):
             simulateOtherValues();
         }
         
-        function updateSpeed(value) {
-            document.getElementById('speed-value').textContent = Math.round(value);
-            
-            // Update history
-            dataHistory.speed.values.push(value);
-            dataHistory.speed.values.shift();
+        // DOM writes and chart redraws queued since the last frame, applied
+        // together once per frame; a later write under the same key replaces
+        // an earlier one
+        const pendingWrites = new Map();
+        const dirtyCharts = new Set();
+        let frameScheduled = false;
+        
+        function scheduleFrame() {
+            if (!frameScheduled) {
+                frameScheduled = true;
+                requestAnimationFrame(flushFrame);
+            }
+        }
+        
+        function flushFrame() {
+            frameScheduled = false;
+            pendingWrites.forEach(write => write());
+            pendingWrites.clear();
+            // 'none' skips the animation pass
+            dirtyCharts.forEach(c => c.update('none'));
+            dirtyCharts.clear();
+        }
+        
+        function queueWrite(key, write) {
+            pendingWrites.set(key, write);
+            scheduleFrame();
+        }
+        
+        function setText(id, text) {
+            const element = ref(id);
+            queueWrite(id, () => { element.textContent = text; });
+        }
+        
+        function markDirty(chart) {
+            dirtyCharts.add(chart);
+            scheduleFrame();
+        }
+        
+        // Shift a sample into a series in place: its 60-value history (which the
+        // history chart plots directly) and its mini chart's 20-value window
+        function pushSample(series, value) {
+            shiftPoints(series.values, value);
             
-            // Update charts
-            if (dataHistory.speed.chart) {
-                dataHistory.speed.chart.data.datasets[0].data = dataHistory.speed.values.slice(-20);
-                dataHistory.speed.chart.update();
+            if (series.chart) {
+                shiftPoints(series.chart.data.datasets[0].data, value);
+                markDirty(series.chart);
             }
+        }
+        
+        function updateSpeed(value) {
+            dataHistory.speed.current = value;
+            setText('speed-value', Math.round(value));
             
+            // Update history and charts
+            pushSample(dataHistory.speed, value);
             if (dataHistory.speedHistory) {
-                dataHistory.speedHistory.data.datasets[0].data = dataHistory.speed.values;
-                dataHistory.speedHistory.update();
+                markDirty(dataHistory.speedHistory);
             }
         }
         
         function updateEngineSpeed(value) {
-            document.getElementById('engine-speed-value').textContent = Math.round(value);
-            
-            // Update history
-            dataHistory.engineSpeed.values.push(value);
-            dataHistory.engineSpeed.values.shift();
-            
-            // Update charts
-            if (dataHistory.engineSpeed.chart) {
-                dataHistory.engineSpeed.chart.data.datasets[0].data = dataHistory.engineSpeed.values.slice(-20);
-                dataHistory.engineSpeed.chart.update();
-            }
+            dataHistory.engineSpeed.current = value;
+            setText('engine-speed-value', Math.round(value));
             
+            // Update history and charts
+            pushSample(dataHistory.engineSpeed, value);
             if (dataHistory.engineSpeedHistory) {
-                dataHistory.engineSpeedHistory.data.datasets[0].data = dataHistory.engineSpeed.values;
-                dataHistory.engineSpeedHistory.update();
+                markDirty(dataHistory.engineSpeedHistory);
             }
         }
         
@@ -520,6 +529,8 @@ class DashboardView(QWidget):
                     options: {
                         responsive: true,
                         maintainAspectRatio: false,
+                        parsing: false,
+                        normalized: true,
                         scales: {
                             x: {
                                 display: false
@@ -538,8 +549,10 @@ class DashboardView(QWidget):
                             }
                         },
                         elements: {
+                            // Straight segments: smoothing is invisible at this size
                             line: {
-                                tension: 0.4
+                                tension: 0,
+                                borderJoinStyle: 'miter'
                             }
                         },
                         animation: false
@@ -548,26 +561,25 @@ class DashboardView(QWidget):
             };
             
             // Create mini charts
-            dataHistory.speed.chart = createMiniChart('speed-chart', dataHistory.speed.values.slice(-20), '#4a90e2');
-            dataHistory.engineSpeed.chart = createMiniChart('engine-speed-chart', dataHistory.engineSpeed.values.slice(-20), '#ff7300');
-            dataHistory.fuelRate.chart = createMiniChart('fuel-rate-chart', dataHistory.fuelRate.values.slice(-20), '#50b432');
-            dataHistory.fuelEconomy.chart = createMiniChart('fuel-economy-chart', dataHistory.fuelEconomy.values.slice(-20), '#ed561b');
-            dataHistory.powerLevel.chart = createMiniChart('power-level-chart', dataHistory.powerLevel.values.slice(-20), '#8884d8');
+            dataHistory.speed.chart = createMiniChart('speed-chart', makePoints(dataHistory.speed.values.slice(-20).map(p => p.y)), '#4a90e2');
+            dataHistory.engineSpeed.chart = createMiniChart('engine-speed-chart', makePoints(dataHistory.engineSpeed.values.slice(-20).map(p => p.y)), '#ff7300');
+            dataHistory.fuelRate.chart = createMiniChart('fuel-rate-chart', makePoints(dataHistory.fuelRate.values.slice(-20).map(p => p.y)), '#50b432');
+            dataHistory.fuelEconomy.chart = createMiniChart('fuel-economy-chart', makePoints(dataHistory.fuelEconomy.values.slice(-20).map(p => p.y)), '#ed561b');
+            dataHistory.powerLevel.chart = createMiniChart('power-level-chart', makePoints(dataHistory.powerLevel.values.slice(-20).map(p => p.y)), '#8884d8');
             
             // Initialize gauges
             updateGauge('oil-temp-gauge', 'oil-temp-value', dataHistory.temperatures.oil, 50, 150);
             updateGauge('coolant-temp-gauge', 'coolant-temp-value', dataHistory.temperatures.coolant, 50, 120);
             updateGauge('fuel-temp-gauge', 'fuel-temp-value', dataHistory.temperatures.fuel, 0, 80);
             
-            // Create larger history charts
-            const timeLabels = Array(60).fill('').map((_, i) => i.toString());
+            // Create larger history charts; the x axis is the sample index, on a
+            // linear scale so the decimation plugin can thin the drawn points
             
             // Speed history chart
             const speedHistoryCtx = document.getElementById('speed-history-chart').getContext('2d');
             dataHistory.speedHistory = new Chart(speedHistoryCtx, {
                 type: 'line',
                 data: {
-                    labels: timeLabels,
                     datasets: [{
                         label: 'Speed (km/h)',
                         data: dataHistory.speed.values,
@@ -581,14 +593,31 @@ class DashboardView(QWidget):
                 options: {
                     responsive: true,
                     maintainAspectRatio: false,
+                    parsing: false,
+                    normalized: true,
+                    spanGaps: true,
                     scales: {
+                        x: {
+                            type: 'linear',
+                            min: 0,
+                            max: 59
+                        },
+                        // Widened to fit the data until the DBC range arrives
+                        // (see applyAxisRanges)
                         y: {
-                            beginAtZero: true
+                            suggestedMin: 0,
+                            suggestedMax: 140
                         }
                     },
                     plugins: {
                         legend: {
                             display: false
+                        },
+                        decimation: {
+                            enabled: true,
+                            algorithm: 'lttb',
+                            samples: 30,
+                            threshold: 30
                         }
                     },
                     elements: {
@@ -605,7 +634,6 @@ class DashboardView(QWidget):
             dataHistory.engineSpeedHistory = new Chart(engineSpeedHistoryCtx, {
                 type: 'line',
                 data: {
-                    labels: timeLabels,
                     datasets: [{
                         label: 'Engine Speed (rpm)',
                         data: dataHistory.engineSpeed.values,
@@ -619,14 +647,31 @@ class DashboardView(QWidget):
                 options: {
                     responsive: true,
                     maintainAspectRatio: false,
+                    parsing: false,
+                    normalized: true,
+                    spanGaps: true,
                     scales: {
+                        x: {
+                            type: 'linear',
+                            min: 0,
+                            max: 59
+                        },
+                        // Widened to fit the data until the DBC range arrives
+                        // (see applyAxisRanges)
                         y: {
-                            beginAtZero: true
+                            suggestedMin: 0,
+                            suggestedMax: 3000
                         }
                     },
                     plugins: {
                         legend: {
                             display: false
+                        },
+                        decimation: {
+                            enabled: true,
+                            algorithm: 'lttb',
+                            samples: 30,
+                            threshold: 30
                         }
                     },
                     elements: {
@@ -643,7 +688,6 @@ class DashboardView(QWidget):
             dataHistory.canMessageChart = new Chart(canMessageCtx, {
                 type: 'line',
                 data: {
-                    labels: timeLabels,
                     datasets: [
                         {
                             label: 'Cylinder Temp',
@@ -664,9 +708,26 @@ class DashboardView(QWidget):
                 options: {
                     responsive: true,
                     maintainAspectRatio: false,
+                    parsing: false,
+                    normalized: true,
+                    spanGaps: true,
                     scales: {
+                        x: {
+                            type: 'linear',
+                            min: 0,
+                            max: 59
+                        },
                         y: {
-                            beginAtZero: false
+                            min: 20,
+                            max: 120
+                        }
+                    },
+                    plugins: {
+                        decimation: {
+                            enabled: true,
+                            algorithm: 'lttb',
+                            samples: 30,
+                            threshold: 30
                         }
                     },
                     elements: {
@@ -683,7 +744,6 @@ class DashboardView(QWidget):
             dataHistory.warningLampsChart = new Chart(warningLampsCtx, {
                 type: 'line',
                 data: {
-                    labels: timeLabels,
                     datasets: [
                         {
                             label: 'Compressor',
@@ -714,12 +774,28 @@ class DashboardView(QWidget):
                 options: {
                     responsive: true,
                     maintainAspectRatio: false,
+                    parsing: false,
+                    normalized: true,
+                    spanGaps: true,
                     scales: {
+                        x: {
+                            type: 'linear',
+                            min: 0,
+                            max: 59
+                        },
                         y: {
-                            beginAtZero: true,
+                            min: 0,
                             max: 1.1
                         }
                     },
+                    plugins: {
+                        decimation: {
+                            enabled: true,
+                            algorithm: 'lttb',
+                            samples: 30,
+                            threshold: 30
+                        }
+                    },
                     elements: {
                         line: {
                             tension: 0
@@ -730,20 +806,26 @@ class DashboardView(QWidget):
             });
             
             // Add some warning events
-            for (let i = 10; i < 15; i++) dataHistory.warningLamps.compressor[i] = 1;
-            for (let i = 30; i < 35; i++) dataHistory.warningLamps.engineWarning[i] = 1;
-            dataHistory.warningLampsChart.update();
+            for (let i = 10; i < 15; i++) dataHistory.warningLamps.compressor[i].y = 1;
+            for (let i = 30; i < 35; i++) dataHistory.warningLamps.engineWarning[i].y = 1;
+            markDirty(dataHistory.warningLampsChart);
         }
         
+        // Gauge id -> angle (degrees) it was last drawn at
+        const gaugeAngles = {};
+        
         // Update temperature gauges
         function updateGauge(id, valueId, value, min, max) {
             // Update value display
-            document.getElementById(valueId).textContent = Math.round(value);
+            setText(valueId, Math.round(value));
             
-            // Calculate rotation (from -90 to 90 degrees)
-            const percentage = (value - min) / (max - min);
-            const rotation = -90 + percentage * 180;
-            document.getElementById(id).style.transform = `rotate(${rotation}deg)`;
+            // Calculate the arc (from 0 to 180 degrees); redraw only on visible change
+            const percentage = Math.max(0, Math.min(1, (value - min) / (max - min)));
+            const angle = percentage * 180;
+            if (gaugeAngles[id] !== undefined && Math.abs(angle - gaugeAngles[id]) < 1) {
+                return;
+            }
+            gaugeAngles[id] = angle;
             
             // Update color based on value
             let color;
@@ -754,15 +836,31 @@ class DashboardView(QWidget):
             } else {
                 color = '#FF5722'; // Red/Orange
             }
-            document.getElementById(id).style.background = color;
+            
+            // Grey track on the right half, value arc clockwise from the top
+            const ctx = ref(id).getContext('2d');
+            queueWrite(id, () => {
+                ctx.clearRect(0, 0, 120, 120);
+                ctx.lineWidth = 12;
+                ctx.beginPath();
+                ctx.arc(60, 60, 54, -Math.PI / 2, Math.PI / 2);
+                ctx.strokeStyle = '#e0e0e0';
+                ctx.stroke();
+                ctx.beginPath();
+                ctx.arc(60, 60, 54, -Math.PI / 2, -Math.PI / 2 + percentage * Math.PI);
+                ctx.strokeStyle = color;
+                ctx.stroke();
+            });
         }
         
         // Simulate other values besides speed and RPM
         function simulateOtherValues() {
             // Fuel level slowly decreases
             dataHistory.fuelLevel = Math.max(0, dataHistory.fuelLevel - 0.05);
-            document.getElementById('fuel-level-value').textContent = Math.round(dataHistory.fuelLevel);
-            document.getElementById('fuel-level-bar').style.width = `${dataHistory.fuelLevel}%`;
+            setText('fuel-level-value', Math.round(dataHistory.fuelLevel));
+            const fuelBar = ref('fuel-level-bar');
+            const fuelWidth = `${dataHistory.fuelLevel}%`;
+            queueWrite('fuel-level-bar', () => { fuelBar.style.width = fuelWidth; });
             
             // Temperatures change slowly
             dataHistory.temperatures.oil += (Math.random() - 0.5) * 2;
@@ -778,50 +876,42 @@ class DashboardView(QWidget):
             updateGauge('fuel-temp-gauge', 'fuel-temp-value', dataHistory.temperatures.fuel, 0, 80);
             
             // CAN message data
-            const lastCylinderTemp = dataHistory.canMessage.cylinderTemp[dataHistory.canMessage.cylinderTemp.length - 1];
-            const lastSensorPressure = dataHistory.canMessage.sensorPressure[dataHistory.canMessage.sensorPressure.length - 1];
+            const canMessage = dataHistory.canMessage;
+            const lastCylinderTemp = canMessage.cylinderTemp[canMessage.cylinderTemp.length - 1].y;
+            const lastSensorPressure = canMessage.sensorPressure[canMessage.sensorPressure.length - 1].y;
             
-            dataHistory.canMessage.cylinderTemp.push(Math.max(30, Math.min(60, lastCylinderTemp + (Math.random() - 0.5) * 2)));
-            dataHistory.canMessage.cylinderTemp.shift();
-            
-            dataHistory.canMessage.sensorPressure.push(Math.max(85, Math.min(115, lastSensorPressure + (Math.random() - 0.5) * 3)));
-            dataHistory.canMessage.sensorPressure.shift();
-            
-            dataHistory.canMessageChart.data.datasets[0].data = dataHistory.canMessage.cylinderTemp;
-            dataHistory.canMessageChart.data.datasets[1].data = dataHistory.canMessage.sensorPressure;
-            dataHistory.canMessageChart.update();
+            shiftPoints(canMessage.cylinderTemp, Math.max(30, Math.min(60, lastCylinderTemp + (Math.random() - 0.5) * 2)));
+            shiftPoints(canMessage.sensorPressure, Math.max(85, Math.min(115, lastSensorPressure + (Math.random() - 0.5) * 3)));
+            markDirty(dataHistory.canMessageChart);
             
             // Warning lamps - shift data and add new values
             for (const type of ['compressor', 'engineWarning', 'brakeActive']) {
-                dataHistory.warningLamps[type].shift();
+                const lamp = dataHistory.warningLamps[type];
+                const previous = lamp[lamp.length - 1].y;
                 
                 // Occasionally generate warnings
                 if (Math.random() > 0.98) {
-                    dataHistory.warningLamps[type].push(1);
-                } else if (dataHistory.warningLamps[type][dataHistory.warningLamps[type].length - 1] === 1 && Math.random() > 0.7) {
+                    shiftPoints(lamp, 1);
+                } else if (previous === 1 && Math.random() > 0.7) {
                     // Reset warnings after they've been active
-                    dataHistory.warningLamps[type].push(0);
+                    shiftPoints(lamp, 0);
                 } else {
                     // Otherwise continue previous state
-                    dataHistory.warningLamps[type].push(dataHistory.warningLamps[type][dataHistory.warningLamps[type].length - 1]);
+                    shiftPoints(lamp, previous);
                 }
             }
-            
-            dataHistory.warningLampsChart.data.datasets[0].data = dataHistory.warningLamps.compressor;
-            dataHistory.warningLampsChart.data.datasets[1].data = dataHistory.warningLamps.engineWarning;
-            dataHistory.warningLampsChart.data.datasets[2].data = dataHistory.warningLamps.brakeActive;
-            dataHistory.warningLampsChart.update();
+            markDirty(dataHistory.warningLampsChart);
         }
         
         // Simulate all updates for testing
         function simulateUpdates() {
             // Speed
-            const currentSpeed = parseFloat(document.getElementById('speed-value').textContent);
+            const currentSpeed = dataHistory.speed.current;
             const newSpeed = Math.max(0, Math.min(120, currentSpeed + (Math.random() - 0.5) * 5));
             updateSpeed(newSpeed);
             
             // Engine speed
-            const currentRPM = parseFloat(document.getElementById('engine-speed-value').textContent);
+            const currentRPM = dataHistory.engineSpeed.current;
             const newRPM = Math.max(800, Math.min(3000, currentRPM + (Math.random() - 0.5) * 100));
             updateEngineSpeed(newRPM);
             
@@ -832,14 +922,24 @@ class DashboardView(QWidget):
         // Initialize everything
         window.onload = function() {
             // Set status
-            document.getElementById('status').textContent = 'Initializing...';
+            ref('status').textContent = 'Initializing...';
             
             // Initialize charts
             initCharts();
             
-            // Start polling for updates (or use simulation if polling fails)
-            document.getElementById('status').textContent = 'Running';
-            setInterval(pollForUpdates, 200); // Poll 5 times per second
+            // Subscribe to data pushed by Python (outside Qt there is no channel)
+            if (typeof QWebChannel !== 'undefined' && window.qt) {
+                new QWebChannel(qt.webChannelTransport, function(channel) {
+                    const bridge = channel.objects.dashboard;
+                    bridge.dataChanged.connect(receiveUpdates);
+                    bridge.axisRangesChanged.connect(applyAxisRanges);
+                    bridge.ready();
+                });
+            }
+            
+            // Refresh from pushed data (or use simulation until there is some)
+            ref('status').textContent = 'Running';
+            setInterval(tick, 200); // Refresh 5 times per second
             
             // Initial simulation to populate charts
             simulateUpdates();
@@ -847,6 +947,116 @@ class DashboardView(QWidget):
     </script>
 </body>
 </html>"""
+
+# Placeholder for values never sent to the page (None is a valid value)
+_UNSENT = object()
+
+class DashboardViewBridge(QObject):
+    """QWebChannel object through which DashboardView pushes data to its page"""
+    # JSON text of the values changed since the previous push
+    dataChanged = pyqtSignal(str)
+    # JSON text of {message: {signal: [minimum, maximum]}} from the DBC
+    axisRangesChanged = pyqtSignal(str)
+    # Re-emitted from the page's slot call on the GUI thread
+    pageReady = pyqtSignal()
+    
+    @pyqtSlot()
+    def ready(self):
+        """Called by the page once its channel is connected"""
+        self.pageReady.emit()
+
+
+class _SerializeSink(QObject):
+    """Carries JSON text serialized on a pool thread back to the GUI thread"""
+    done = pyqtSignal(str, object)  # JSON text, changes it was made from
+
+
+class _SerializeJob(QRunnable):
+    """Serializes one batch of changed values off the GUI thread"""
+    
+    def __init__(self, changes, sink):
+        super().__init__()
+        self.changes = changes
+        self.sink = sink
+    
+    def run(self):
+        try:
+            self.sink.done.emit(dumps(self.changes), self.changes)
+        except Exception as e:
+            logging.getLogger("DashboardView").error(f"Error serializing dashboard data: {e}")
+
+
+class DashboardView(QWidget):
+    """Modern dashboard view using web technologies for visualization"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger("DashboardView")
+        self.message_processor = None
+        self.dbc_parser = None
+        self.logger.info("Initializing dashboard view")
+        
+        # Store messages temporarily
+        self.recent_messages = {}
+        # (message name, signal name) -> last value pushed to the page, recorded
+        # once its batch has been serialized and handed over
+        self._last_sent = {}
+        
+        # Batches are serialized on a single pool thread, so they reach the
+        # page in order
+        self._serialize_pool = QThreadPool(self)
+        self._serialize_pool.setMaxThreadCount(1)
+        self._serialize_sink = _SerializeSink(self)
+        self._serialize_sink.done.connect(self.on_changes_serialized)
+        
+        # Initialize UI
+        self.init_ui()
+        
+        # Update timer - each tick pushes the messages decoded since the last one.
+        # It only runs while the view is shown (see showEvent/hideEvent)
+        self.update_timer = QTimer(self)
+        self.update_timer.setInterval(200)  # Update 5 times per second
+        self.update_timer.timeout.connect(self.update_dashboard)
+    
+    def showEvent(self, event):
+        """Resume pushing updates to the page"""
+        self.update_timer.start()
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        """Stop pushing updates while the view is not on screen"""
+        # The latest values stay in recent_messages and go out on the first
+        # tick after the view is shown again
+        self.update_timer.stop()
+        super().hideEvent(event)
+    
+    def init_ui(self):
+        """Initialize the user interface"""
+        # Create layout
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        if not HAS_WEBENGINE:
+            # If web engine is not available, show a message
+            layout.addWidget(QLabel("PyQtWebEngine is not available. Please install it with: pip install PyQtWebEngine"))
+            self.logger.warning("PyQtWebEngine not available - dashboard functionality limited")
+            return
+        
+        # Create web view
+        self.web_view = QWebEngineView()
+        
+        # Expose the bridge to the page as "dashboard"; data is pushed through
+        # it instead of the page polling for it
+        self.bridge = DashboardViewBridge(self)
+        self.bridge.pageReady.connect(self.on_page_ready)
+        self.channel = QWebChannel(self.web_view.page())
+        self.channel.registerObject("dashboard", self.bridge)
+        self.web_view.page().setWebChannel(self.channel)
+        
+        # Hand the page to the view from memory; nothing is written to disk
+        self.web_view.setHtml(DASHBOARD_HTML, DASHBOARD_BASE_URL)
+            
+        layout.addWidget(self.web_view)
     
     def init_web_channel(self, message_processor, dbc_parser):
         """Initialize with the message processor"""
@@ -856,26 +1066,84 @@ class DashboardView(QWidget):
         # Connect signals to update dashboard
         if message_processor:
             message_processor.message_decoded.connect(self.on_message_decoded)
+        
+        self.push_axis_ranges()
     
     def on_message_decoded(self, frame_id, message_name, signals, interface):
         """Handle a decoded CAN message"""
-        # Store the message for the next update cycle
-        self.recent_messages[message_name] = signals
-        self.logger.debug(f"Stored message for dashboard: {message_name}")
+        wanted = PAGE_SIGNALS.get(message_name)
+        if wanted is None:
+            return
+        
+        # Store the signals the page shows for the next update cycle
+        self.recent_messages[message_name] = {
+            name: signals[name] for name in wanted if name in signals
+        }
+        self.logger.debug("Stored message for dashboard: %s", message_name)
+    
+    def on_page_ready(self):
+        """Push everything again once the page's channel is connected"""
+        # Values pushed before the page was listening never arrived
+        self._last_sent = {}
+        self.push_axis_ranges()
+    
+    def push_axis_ranges(self):
+        """Send the DBC minimum/maximum of the page's signals to the page"""
+        if not hasattr(self, 'bridge') or self.dbc_parser is None or self.dbc_parser.db is None:
+            return
+        
+        ranges = {}
+        for message_name, signal_names in PAGE_SIGNALS.items():
+            try:
+                message = self.dbc_parser.db.get_message_by_name(message_name)
+            except KeyError:
+                continue
+            for signal in message.signals:
+                if (signal.name in signal_names and signal.minimum is not None
+                        and signal.maximum is not None and signal.minimum < signal.maximum):
+                    ranges.setdefault(message_name, {})[signal.name] = [signal.minimum, signal.maximum]
+        
+        if ranges:
+            self.bridge.axisRangesChanged.emit(dumps(ranges))
     
     def update_dashboard(self):
         """Update the dashboard with recent messages"""
         if not self.recent_messages:
             return
+        
+        # Only push values that differ from what the page already has
+        last_sent = self._last_sent
+        changes = {}
+        for message_name, signals in self.recent_messages.items():
+            changed = {}
+            for signal_name, value in signals.items():
+                key = (message_name, signal_name)
+                if last_sent.get(key, _UNSENT) != value:
+                    changed[signal_name] = value
+            if changed:
+                changes[message_name] = changed
+        
+        # Clear recent messages
+        self.recent_messages = {}
+        if not changes:
+            return
             
         try:
-            # Write messages to a JSON file that the web view can read
-            data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashboard-data.json")
-            with open(data_path, "w", encoding="utf-8") as f:
-                json.dump(self.recent_messages, f)
-                
-            # Clear recent messages
-            self.recent_messages = {}
+            # Push the batch to the page in one message; the dict is new and
+            # handed over to the serializer
+            if hasattr(self, 'bridge'):
+                self._serialize_pool.start(_SerializeJob(changes, self._serialize_sink))
             
         except Exception as e:
-            self.logger.error(f"Error updating dashboard: {e}")
\ No newline at end of file
+            self.logger.error(f"Error updating dashboard: {e}")
+    
+    def on_changes_serialized(self, data_json, changes):
+        """Send a batch serialized by _SerializeJob to the page"""
+        if hasattr(self, 'bridge'):
+            self.bridge.dataChanged.emit(data_json)
+            # Only now does the page have these values; a failed batch leaves
+            # them unrecorded so the next tick pushes them again
+            last_sent = self._last_sent
+            for message_name, changed in changes.items():
+                for signal_name, value in changed.items():
+                    last_sent[(message_name, signal_name)] = value
@@ -1,13 +1,195 @@
 import cantools
 import logging
+import math
 from collections import defaultdict
 
+# Masks tried when a frame ID is not found directly. This handles differences
+# in how some CAN interfaces represent extended IDs
+ALTERNATIVE_ID_MASKS = (
+    0x1FFFFFFF,  # 29-bit ID mask for J1939
+    0x0FFFFFFF,  # Check without the first nibble
+    0x00FFFFFF,  # Check without the first byte
+)
+
+def compile_codec(message):
+    """
+    Precompute per-signal shifts, masks and scaling for a message
+    
+    Returns:
+        tuple of signal specs, or None when the message needs the full
+        cantools decoder (multiplexed, container or float signals)
+    """
+    if message.is_multiplexed() or getattr(message, 'is_container', False):
+        return None
+    
+    frame_bits = 8 * message.length
+    specs = []
+    for signal in message.signals:
+        if signal.is_float:
+            return None
+        
+        if signal.byte_order == 'little_endian':
+            shift = signal.start
+        else:
+            # Motorola start bit is the MSB in sawtooth numbering; convert it
+            # to a shift from the LSB of the big-endian frame integer
+            msb = 8 * (signal.start // 8) + 7 - (signal.start % 8)
+            shift = frame_bits - msb - signal.length
+        if shift < 0 or shift + signal.length > frame_bits:
+            return None
+        
+        specs.append((
+            signal.name,
+            signal.byte_order == 'little_endian',
+            shift,
+            (1 << signal.length) - 1,
+            (1 << (signal.length - 1)) if signal.is_signed else 0,
+            1 << signal.length,
+            signal.scale,
+            signal.offset,
+            signal.choices or None,
+        ))
+    return tuple(specs)
+
+def compile_decoder(message):
+    """
+    Generate a decode(data) function specialised for one message
+    
+    Shifts, masks, sign extension and scaling from compile_codec are inlined
+    as constants so decoding does no per-signal lookups or loops.
+    
+    Returns:
+        function, or None when the message needs the full cantools decoder
+    """
+    codec = compile_codec(message)
+    if codec is None:
+        return None
+    
+    length = message.length
+    namespace = {}
+    lines = [
+        "def decode(data):",
+        f"    excess = len(data) - {length}",
+        "    if excess < 0:",
+        f"        raise ValueError(f'Wrong data size: {{len(data)}} instead of {length} bytes')",
+    ]
+    if any(spec[1] for spec in codec):
+        lines.append("    little = int.from_bytes(data, 'little')")
+    if not all(spec[1] for spec in codec):
+        lines.append("    big = int.from_bytes(data, 'big') >> (8 * excess)")
+    
+    items = []
+    for i, (name, is_little, shift, mask, sign_bit, span, scale, offset, choices) in enumerate(codec):
+        if not all(isinstance(c, int) or math.isfinite(c) for c in (scale, offset)):
+            return None
+        
+        source = 'little' if is_little else 'big'
+        lines.append(f"    v{i} = ({source} >> {shift}) & {mask}")
+        if sign_bit:
+            lines.append(f"    if v{i} & {sign_bit}:")
+            lines.append(f"        v{i} -= {span}")
+        
+        # Integer identity scaling keeps the raw int, matching cantools
+        scaled = f"v{i}"
+        if not (isinstance(scale, int) and scale == 1):
+            scaled += f" * {scale!r}"
+        if not (isinstance(offset, int) and offset == 0):
+            scaled += f" + ({offset!r})"
+        
+        if choices is not None:
+            namespace[f"choices{i}"] = choices
+            lines.append(f"    v{i} = choices{i}[v{i}] if v{i} in choices{i} else {scaled}")
+        elif scaled != f"v{i}":
+            lines.append(f"    v{i} = {scaled}")
+        items.append(f"{name!r}: v{i}")
+    
+    lines.append("    return {" + ", ".join(items) + "}")
+    exec("\n".join(lines), namespace)
+    return namespace['decode']
+
+def compile_encoder(message):
+    """
+    Generate an encode(values) function specialised for one message
+    
+    The generated function handles the common case (exactly the message's
+    signals, numeric values within range) with inlined range checks and bit
+    packing. It returns None for anything else so the caller can fall back to
+    cantools, which produces the proper result or error.
+    
+    Returns:
+        function, or None when the message needs the full cantools encoder
+    """
+    codec = compile_codec(message)
+    if not codec:
+        return None
+    
+    length = message.length
+    namespace = {'_NUMERIC': (int, float)}
+    lines = [
+        "def encode(values):",
+        f"    if len(values) != {len(codec)}:",
+        "        return None",
+        "    try:",
+    ]
+    for i, spec in enumerate(codec):
+        lines.append(f"        v{i} = values[{spec[0]!r}]")
+    lines += [
+        "    except KeyError:",
+        "        return None",
+        "    little = 0",
+        "    big = 0",
+    ]
+    
+    for i, ((name, is_little, shift, mask, sign_bit, span, scale, offset, choices), signal) in \
+            enumerate(zip(codec, message.signals)):
+        conversion = getattr(signal, 'conversion', None)
+        if conversion is None or not hasattr(conversion, 'numeric_scaled_to_raw'):
+            return None
+        
+        lines.append(f"    if v{i}.__class__ not in _NUMERIC:")
+        lines.append("        return None")
+        
+        # Same scaled-value range check (and tolerance) as cantools' strict mode
+        tolerance = abs(scale) * 1e-6
+        if signal.minimum is not None:
+            lines.append(f"    if v{i} < {signal.minimum - tolerance!r}:")
+            lines.append("        return None")
+        if signal.maximum is not None:
+            lines.append(f"    if v{i} > {signal.maximum + tolerance!r}:")
+            lines.append("        return None")
+        
+        # Raw conversion is delegated so rounding matches cantools exactly
+        namespace[f"to_raw{i}"] = conversion.numeric_scaled_to_raw
+        lines.append(f"    r{i} = to_raw{i}(v{i})")
+        low, high = (-sign_bit, sign_bit - 1) if sign_bit else (0, mask)
+        lines.append(f"    if r{i} < {low} or r{i} > {high}:")
+        lines.append("        return None")
+        
+        target = 'little' if is_little else 'big'
+        lines.append(f"    {target} |= (r{i} & {mask}) << {shift}")
+    
+    lines.append(f"    return (big | int.from_bytes(little.to_bytes({length}, 'little'), 'big')).to_bytes({length}, 'big')")
+    exec("\n".join(lines), namespace)
+    return namespace['encode']
+
 class DBCParser:
     """Handles parsing and management of DBC files"""
     def __init__(self, dbc_file_path=None):
         self.db = None
         self.message_by_id = {}
         self.signals_by_message = defaultdict(list)
+        # Received frame ID -> resolved message, so alternative-ID resolution
+        # only happens the first time a known ID is seen. Misses are not cached:
+        # unknown IDs (e.g. arbitrary J1939 source addresses) are unbounded
+        self._resolved_ids = {}
+        # Frame ID -> generated decode/encode functions (None means use cantools)
+        self._decoders = {}
+        self._encoders = {}
+        # Flat (message, signal) rows for selection dialogs, built once per DBC
+        self.signal_catalog = []
+        # (frame ID, signal name) -> catalog row, and frame ID -> {signal name: unit}
+        self.signal_index = {}
+        self.units_by_message = {}
         self.logger = logging.getLogger("DBCParser")
         
         if dbc_file_path:
@@ -22,16 +204,39 @@ class DBCParser:
             # Create lookup tables for faster access
             self.message_by_id = {}
             self.signals_by_message = defaultdict(list)
+            self._resolved_ids = {}
+            self._decoders = {}
+            self._encoders = {}
             
             for message in self.db.messages:
                 # Store both standard and extended format of ID for maximum compatibility
                 # This helps with inconsistent ID handling in some CAN interfaces
                 self.logger.info(f"Loading message: {message.name}, ID: 0x{message.frame_id:X}")
                 self.message_by_id[message.frame_id] = message
+                self._decoders[message.frame_id] = compile_decoder(message)
+                self._encoders[message.frame_id] = compile_encoder(message)
                 
                 # Aleo store signals by message for easy access
-                for signal in message.signals:
-                    self.signals_by_message[message.frame_id].append(signal)
+                self.signals_by_message[message.frame_id].extend(message.signals)
+            
+            # Flat signal catalog for the selection dialogs
+            self.signal_catalog = [
+                {
+                    'message_id': message.frame_id,
+                    'message_name': message.name,
+                    'signal_name': signal.name,
+                    'unit': signal.unit or ""
+                }
+                for message in self.db.messages
+                for signal in message.signals
+            ]
+            self.signal_index = {
+                (row['message_id'], row['signal_name']): row for row in self.signal_catalog
+            }
+            self.units_by_message = defaultdict(dict)
+            for row in self.signal_catalog:
+                self.units_by_message[row['message_id']][row['signal_name']] = row['unit']
+            self.units_by_message = dict(self.units_by_message)
             
             self.logger.info(f"Loaded {len(self.db.messages)} messages from DBC file")
             return True
@@ -41,23 +246,23 @@ class DBCParser:
     
     def get_message_by_id(self, frame_id):
         """Get message definition by frame ID"""
-        # Try direct lookup
-        if frame_id in self.message_by_id:
-            return self.message_by_id[frame_id]
-        
-        # Try alternative formats if direct lookup fails
-        # This handles differences in how some CAN interfaces represent extended IDs
-        alternative_ids = [
-            frame_id & 0x1FFFFFFF,  # 29-bit ID mask for J1939
-            frame_id & 0x0FFFFFFF,  # Check without the first nibble
-            frame_id & 0x00FFFFFF,  # Check without the first byte
-        ]
+        # Fast path - ID has been resolved before
+        try:
+            return self._resolved_ids[frame_id]
+        except KeyError:
+            pass
         
-        for alt_id in alternative_ids:
-            if alt_id in self.message_by_id:
-                return self.message_by_id[alt_id]
+        # Try direct lookup, then alternative formats if that fails
+        message = self.message_by_id.get(frame_id)
+        if message is None:
+            for mask in ALTERNATIVE_ID_MASKS:
+                message = self.message_by_id.get(frame_id & mask)
+                if message is not None:
+                    break
         
-        return None
+        if message is not None:
+            self._resolved_ids[frame_id] = message
+        return message
     
     def get_signals_for_message(self, frame_id):
         """Get all signals for a specific message ID"""
@@ -66,27 +271,57 @@ class DBCParser:
             return message.signals
         return []
     
+    def get_signal_catalog(self):
+        """Get every signal in the DBC as message_id/message_name/signal_name/unit rows"""
+        return self.signal_catalog
+    
+    def get_signal_info(self, frame_id, signal_name):
+        """Get the catalog row for one signal of a DBC message, or None"""
+        return self.signal_index.get((frame_id, signal_name))
+    
+    def get_signal_units(self, message):
+        """Get the {signal name: unit} mapping for a resolved message"""
+        return self.units_by_message.get(message.frame_id, {})
+    
     def get_all_message_ids(self):
         """Get list of all message IDs"""
         return list(self.message_by_id.keys())
     
     def decode_message(self, frame_id, data):
         """Decode message data using the DBC definitions"""
+        return self.decode_frame(frame_id, data)[1]
+    
+    def decode_frame(self, frame_id, data):
+        """
+        Resolve and decode a frame with a single message lookup
+        
+        Returns:
+            tuple: (message, decoded_data); either may be None
+        """
         message = self.get_message_by_id(frame_id)
-        if message:
-            try:
-                return self.db.decode_message(frame_id, data)
-            except Exception as e:
-                self.logger.error(f"Error decoding message ID 0x{frame_id:X}: {e}")
-        return None
+        if message is None:
+            return None, None
+        try:
+            decoder = self._decoders.get(message.frame_id)
+            if decoder is None:
+                return message, message.decode(data)
+            return message, decoder(data)
+        except Exception as e:
+            self.logger.error("Error decoding message ID 0x%X: %s", frame_id, e)
+            return message, None
     
     def encode_message(self, frame_id, data_dict):
         """Encode message data using the DBC definitions"""
         message = self.get_message_by_id(frame_id)
         if message:
             try:
-                self.logger.info(f"Encoding message ID 0x{frame_id:X}, DB ID 0x{message.frame_id:X}")
-                return self.db.encode_message(frame_id, data_dict)
+                self.logger.debug("Encoding message ID 0x%X, DB ID 0x%X", frame_id, message.frame_id)
+                encoder = self._encoders.get(message.frame_id)
+                if encoder is not None:
+                    data = encoder(data_dict)
+                    if data is not None:
+                        return data
+                return message.encode(data_dict)
             except Exception as e:
                 self.logger.error(f"Error encoding message ID 0x{frame_id:X}: {e}")
         return None
\ No newline at end of file
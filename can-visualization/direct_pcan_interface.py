@@ -16,6 +16,8 @@ class DirectPCANInterface:
         self.running = False
         self.sender_bus = None
         self.receiver_bus = None
+        self.receiver_notifier = None
+        self.receiver_reader = None
         self.receive_callback = None
         self.logger = logging.getLogger("DirectPCANInterface")
         
@@ -50,7 +52,12 @@ class DirectPCANInterface:
             self.sender_bus.send(test_msg)
             self.logger.info("Hardware connectivity verified")
             
-            # Start receiver thread
+            # The notifier only reads the bus and queues frames on its own
+            # thread, so slow decoding can't hold up bus reads
+            self.receiver_reader = can.BufferedReader()
+            self.receiver_notifier = can.Notifier(self.receiver_bus, [self.receiver_reader], timeout=0.1)
+            
+            # Start receiver (decode) thread
             self.running = True
             self.receive_thread = threading.Thread(
                 target=self._receive_thread, 
@@ -71,18 +78,15 @@ class DirectPCANInterface:
         """Thread function to receive messages"""
         self.logger.info("Receiver thread running")
     
-        count = 0
-        while self.running and self.receiver_bus:
+        while self.running and self.receiver_reader is not None:
             try:
-                # Wait for a message with timeout
-                count += 1
-                if count % 10 == 0:
-                    self.logger.info(f"DirectPCAN waiting for message (count={count})")
-                
-                message = self.receiver_bus.recv(1.0)  # 1 second timeout
+                # Wait for a queued message with timeout
+                message = self.receiver_reader.get_message(timeout=1.0)  # 1 second timeout
             
                 if message is not None:
-                    self.logger.info(f"DirectPCAN received message: ID=0x{message.arbitration_id:X}, data={[hex(b) for b in message.data]}")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("DirectPCAN received message: ID=0x%X, data=%s",
+                                          message.arbitration_id, message.data.hex())
                     if self.receive_callback:
                         # Call the callback with the message and interface name
                         self.receive_callback(message, "receiver")
@@ -118,6 +122,12 @@ class DirectPCANInterface:
         if hasattr(self, 'receive_thread') and self.receive_thread.is_alive():
             self.receive_thread.join(timeout=2.0)
         
+        # Stop the notifier before its bus
+        if self.receiver_notifier is not None:
+            self.receiver_notifier.stop()
+            self.receiver_notifier = None
+        self.receiver_reader = None
+        
         # Shutdown buses
         if self.sender_bus:
             try:
@@ -153,24 +163,22 @@ class DirectPCANMessageProcessor:
     def process_message(self, msg, interface_name):
         """Process a received CAN message"""
         try:
-            self.logger.info(f"Processing message ID=0x{msg.arbitration_id:X} from {interface_name}")
+            self.logger.debug("Processing message ID=0x%X from %s", msg.arbitration_id, interface_name)
         
-            # Decode the message using DBC
-            decoded_data = self.dbc_parser.decode_message(msg.arbitration_id, msg.data)
+            # Resolve and decode the message using DBC in one lookup
+            message, decoded_data = self.dbc_parser.decode_frame(msg.arbitration_id, msg.data)
         
             if decoded_data:
-                # Get message information
-                message = self.dbc_parser.get_message_by_id(msg.arbitration_id)
-                message_name = message.name if message else f"Unknown_0x{msg.arbitration_id:X}"
+                message_name = message.name
             
-                self.logger.info(f"Decoded message {message_name} with values {decoded_data}")
+                self.logger.debug("Decoded message %s with values %r", message_name, decoded_data)
             
                 # Notify all callbacks
                 for callback in self.callbacks:
                     callback(msg.arbitration_id, message_name, decoded_data, interface_name)
             else:
                 # Log unknown message
-                data_hex = ' '.join(f'{b:02X}' for b in msg.data)
+                data_hex = msg.data.hex(' ').upper()
                 self.logger.warning(f"Undecodable message: ID=0x{msg.arbitration_id:X}, Data={data_hex}")
             
         except Exception as e:
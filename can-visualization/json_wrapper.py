@@ -0,0 +1,41 @@
+"""
+This module provides a fast JSON encoder for dashboard payloads
+Import this instead of calling json.dumps directly on per-update paths
+
+If orjson is available it is used to encode in a single C-level pass;
+otherwise the standard library json module is used with compact separators.
+"""
+
+import logging
+logger = logging.getLogger("JSONWrapper")
+
+try:
+    import orjson
+    logger.info("Using orjson for JSON encoding")
+    HAS_ORJSON = True
+    
+    _OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+    
+    def dumps_bytes(obj):
+        """Serialize obj to compact UTF-8 encoded JSON"""
+        return orjson.dumps(obj, option=_OPTIONS)
+    
+    def dumps(obj):
+        """Serialize obj to a compact JSON string"""
+        return orjson.dumps(obj, option=_OPTIONS).decode("utf-8")
+        
+except ImportError:
+    import json
+    logger.info("orjson not available - using standard json module")
+    HAS_ORJSON = False
+    
+    def dumps_bytes(obj):
+        """Serialize obj to compact UTF-8 encoded JSON"""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    
+    def dumps(obj):
+        """Serialize obj to a compact JSON string"""
+        return json.dumps(obj, separators=(",", ":"))
+
+# Export the functions
+__all__ = ["dumps", "dumps_bytes", "HAS_ORJSON"]
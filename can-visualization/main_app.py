@@ -1,10 +1,12 @@
 import sys
 import argparse
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout,
                            QHBoxLayout, QPushButton, QLabel, QFileDialog, QMessageBox,
                            QSplitter, QTreeWidget, QTreeWidgetItem, QComboBox, QCheckBox)
-from PyQt5.QtCore import Qt, QSettings
+from PyQt5.QtCore import Qt
 
 # Import both interface options
 from can_interface import CANInterface
@@ -15,10 +17,8 @@ from can_simulator import DualCANSimulator
 from signal_display import SignalTableWidget, SignalPlotWidget
 import time
 
-# Import the new dashboard view
-from dashboard_view import DashboardView
+# Import the dashboard view
 from configurable_dashboard_view import ConfigurableDashboardView
-import sys
 print(f"Running python version: {sys.version}")
 
 
@@ -29,16 +29,14 @@ class CANVisApp(QMainWindow):
 
 
         
+        # Parse command line arguments
+        self.args = self.parse_arguments()
+
         # Setup logging
         self.setup_logging()
         self.logger = logging.getLogger("CANVisApp")
         self.logger.info("Starting CAN visualization application")
 
-
-
-        # Parse command line arguments
-        self.args = self.parse_arguments()
-
         # Initialize UI components
         self.init_ui()
 
@@ -59,14 +57,22 @@ class CANVisApp(QMainWindow):
     
     def setup_logging(self):
         """Configure logging"""
+        # Records are formatted by the QueueHandler on the calling thread, but
+        # the console/file writes happen on the listener's background thread
+        # so disk I/O never blocks the GUI or CAN receive threads
+        log_queue = queue.SimpleQueue()
+        self.log_listener = QueueListener(
+            log_queue,
+            logging.StreamHandler(),
+            logging.FileHandler('canvis.log')
+        )
+        # Per-frame DEBUG output is only produced when asked for with --debug
         logging.basicConfig(
-            level=logging.INFO,
+            level=logging.DEBUG if self.args.debug else logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler('canvis.log')
-            ]
+            handlers=[QueueHandler(log_queue)]
         )
+        self.log_listener.start()
     
     def parse_arguments(self):
         """Parse command line arguments"""
@@ -78,6 +84,8 @@ class CANVisApp(QMainWindow):
         # Add new dashboard mode argument
         parser.add_argument('--dashboard', action='store_true',
                           help='Enable modern dashboard interface')
+        parser.add_argument('--debug', action='store_true',
+                          help='Enable per-frame debug logging')
         return parser.parse_args()
     
     def init_ui(self):
@@ -333,8 +341,8 @@ class CANVisApp(QMainWindow):
         # Create simulator if not already created
         if not self.simulator:
             self.simulator = DualCANSimulator(self.dbc_parser)
-            self.simulator.add_sender_callback(self.message_processor.process_message)
-            self.simulator.add_receiver_callback(self.message_processor.process_message)
+            self.simulator.add_sender_batch_callback(self.message_processor.process_batch)
+            self.simulator.add_receiver_batch_callback(self.message_processor.process_batch)
         
         # Start simulator
         self.simulator.start()
@@ -426,48 +434,34 @@ class CANVisApp(QMainWindow):
     
     def on_message_decoded(self, frame_id, message_name, signals, interface):
         """Handle decoded CAN message from standard interface"""
-        self.logger.info(f"Decoded message received: ID=0x{frame_id:X}, Name={message_name}, Interface={interface}")
-        self.logger.info(f"Signal values: {signals}")
+        self.logger.debug("Decoded message received: ID=0x%X, Name=%s, Interface=%s, Signals=%r",
+                          frame_id, message_name, interface, signals)
         self._update_ui_with_message(frame_id, message_name, signals, interface)
     
     def on_direct_pcan_message(self, frame_id, message_name, signals, interface):
         """Handle message from DirectPCANInterface"""
-        self.logger.info(f"DirectPCAN message received: ID=0x{frame_id:X}, Name={message_name}, Interface={interface}")
-        self.logger.info(f"Signal values: {signals}")
+        self.logger.debug("DirectPCAN message received: ID=0x%X, Name=%s, Interface=%s, Signals=%r",
+                          frame_id, message_name, interface, signals)
         self._update_ui_with_message(frame_id, message_name, signals, interface)
     
     def _update_ui_with_message(self, frame_id, message_name, signals, interface):
         """Update UI with message data"""
-        self.logger.info(f"Updating UI with message: {message_name}, signals: {signals}")
-    
         # In dashboard mode, no need to update traditional UI
         if self.args.dashboard:
             return
     
-        # Update signal table and plot for each signal
-        for signal_name, value in signals.items():
-            # Get unit if available
-            message = self.dbc_parser.get_message_by_id(frame_id)
-            if not message:
-                self.logger.warning(f"No message definition found for ID 0x{frame_id:X}")
-                continue
-                
-            unit = ""
-            for signal in message.signals:
-                if signal.name == signal_name:
-                    unit = signal.unit or ""
-                    break
-        
-            # Update table
-            self.logger.info(f"Updating table for signal: {signal_name}={value} {unit}")
-            self.table_widget.update_signal(
-                frame_id, message_name, signal_name, value, unit, interface
-            )
-        
-            # Update plot
-            self.plot_widget.add_data_point(
-                frame_id, message_name, signal_name, value, unit, interface
-            )
+        # Get units once for the whole frame
+        message = self.dbc_parser.get_message_by_id(frame_id)
+        if not message:
+            self.logger.warning(f"No message definition found for ID 0x{frame_id:X}")
+            return
+        units = self.dbc_parser.get_signal_units(message)
+    
+        # Update signal table and plot with all signals of the frame at once,
+        # stamped with a single arrival time
+        current_time = time.time()
+        self.table_widget.update_signals(frame_id, message_name, signals, units, interface, current_time)
+        self.plot_widget.add_data_points(frame_id, message_name, signals, units, interface, current_time)
     
     def on_unknown_message(self, frame_id, data_hex, interface):
         """Handle unknown CAN message"""
@@ -484,6 +478,9 @@ class CANVisApp(QMainWindow):
         # Save settings
         self.save_settings()
         
+        # Flush any queued log records
+        self.log_listener.stop()
+        
         # Accept the close event
         event.accept()
 
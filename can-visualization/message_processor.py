@@ -1,7 +1,17 @@
 import can
 import logging
+import time
+from collections import deque
 from PyQt5.QtCore import QObject, pyqtSignal
 
+# Most decoded messages waiting for the GUI thread; beyond this the oldest are
+# dropped so memory stays bounded when the UI can't keep up with the bus
+MAX_PENDING_MESSAGES = 10000
+
+# Most unknown frame IDs remembered as already logged; past this the set is
+# cleared (those IDs may be logged once more) so it can't grow without bound
+MAX_UNKNOWN_IDS = 1024
+
 class MessageProcessor(QObject):
     """
     Processes CAN messages using DBC definitions and emits signals for UI updates
@@ -9,17 +19,42 @@ class MessageProcessor(QObject):
     # Define signals for UI updates
     message_decoded = pyqtSignal(int, str, dict, str)  # frame_id, name, signals, interface
     unknown_message = pyqtSignal(int, str, str)  # frame_id, data_hex, interface
+    # Internal: wakes the processor's own thread to deliver pending messages
+    _pending_ready = pyqtSignal()
     
     def __init__(self, can_interface, dbc_parser):
         super().__init__()
         self.can_interface = can_interface
         self.dbc_parser = dbc_parser
         self.logger = logging.getLogger("MessageProcessor")
+        # Frame IDs with no DBC definition that have already been logged
+        self.unknown_ids = set()
+        
+        # (signal, args) waiting to be emitted on the processor's thread. The
+        # deque drops the oldest entry when full; appends and pops are atomic
+        self._pending = deque(maxlen=MAX_PENDING_MESSAGES)
+        # True while a wake-up is queued, so a burst posts only one event
+        self._wake_posted = False
+        self._dropped = 0
+        self._last_drop_warning = 0.0
+        self._pending_ready.connect(self._deliver_pending)
         
         # Set up callbacks for all receiver interfaces
         for name, config in can_interface.interfaces.items():
             if config['role'] in ['receiver', 'both']:
                 can_interface.set_receive_callback(name, self.process_message)
+                can_interface.set_receive_batch_callback(name, self.process_batch)
+    
+    def process_batch(self, messages, interface_name):
+        """
+        Process all CAN messages drained from an interface in one wake-up
+    
+        Args:
+            messages: List of can.Message objects
+            interface_name: Name of the interface that received the messages
+        """
+        for msg in messages:
+            self.process_message(msg, interface_name)
     
     def process_message(self, msg, interface_name):
         """
@@ -30,41 +65,79 @@ class MessageProcessor(QObject):
             interface_name: Name of the interface that received the message
         """
         try:
-            # Get frame ID for logging
-            frame_id_str = f"0x{msg.arbitration_id:X}"
-            self.logger.info(f"Processing message {frame_id_str} from {interface_name}, data={[hex(b) for b in msg.data]}")
+            # This runs for every frame - keep logging lazy so nothing is
+            # formatted unless DEBUG is actually enabled
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Processing message 0x%X from %s, data=%s",
+                                  msg.arbitration_id, interface_name, msg.data.hex())
         
-            # Try to decode the message using DBC
-            decoded_data = self.dbc_parser.decode_message(msg.arbitration_id, msg.data)
+            # Resolve and decode the message using DBC in one lookup
+            message, decoded_data = self.dbc_parser.decode_frame(msg.arbitration_id, msg.data)
         
             if decoded_data:
-                # Get message definition for additional info
-                message = self.dbc_parser.get_message_by_id(msg.arbitration_id)
-                message_name = message.name if message else "Unknown"
+                message_name = message.name
             
-                self.logger.info(f"Successfully decoded message {frame_id_str}: {message_name} with values {decoded_data}")
+                self.logger.debug("Decoded message 0x%X: %s with values %r",
+                                  msg.arbitration_id, message_name, decoded_data)
             
-                # Emit signal with decoded data
-                self.message_decoded.emit(
+                # Queue signal with decoded data
+                self._post(self.message_decoded, (
                     msg.arbitration_id,
                     message_name,
                     decoded_data,
                     interface_name
-                )
-                self.logger.info(f"Emitted message_decoded signal for {message_name}")
+                ))
             else:
                 # Unknown or undecodable message
-                data_hex = ' '.join(f'{b:02X}' for b in msg.data)
-                self.logger.warning(f"Unknown message {frame_id_str}: {data_hex}")
-                self.unknown_message.emit(
+                data_hex = msg.data.hex(' ').upper()
+                if msg.arbitration_id not in self.unknown_ids:
+                    if message is None:
+                        # Warn once per unknown ID, so a stream of frames the
+                        # DBC doesn't define can't flood the log
+                        if len(self.unknown_ids) >= MAX_UNKNOWN_IDS:
+                            self.unknown_ids.clear()
+                        self.unknown_ids.add(msg.arbitration_id)
+                    self.logger.warning("Unknown message 0x%X: %s", msg.arbitration_id, data_hex)
+                self._post(self.unknown_message, (
                     msg.arbitration_id,
                     data_hex,
                     interface_name
-                )
+                ))
             
         except Exception as e:
             self.logger.error(f"Error processing message: {e}")
     
+    def _post(self, signal, args):
+        """Queue a signal emission for the processor's thread"""
+        pending = self._pending
+        if len(pending) == pending.maxlen:
+            self._dropped += 1
+        pending.append((signal, args))
+        if not self._wake_posted:
+            self._wake_posted = True
+            # Queued when called from a receive thread, direct on our own thread
+            self._pending_ready.emit()
+    
+    def _deliver_pending(self):
+        """Emit every queued message on the processor's thread"""
+        # Clear the flag before draining, so a message queued meanwhile either
+        # gets drained below or posts a fresh wake-up
+        self._wake_posted = False
+        pending = self._pending
+        while True:
+            try:
+                signal, args = pending.popleft()
+            except IndexError:
+                break
+            signal.emit(*args)
+        
+        if self._dropped:
+            now = time.monotonic()
+            if now - self._last_drop_warning >= 1.0:
+                self.logger.warning("Dropped %d decoded messages - UI can't keep up", self._dropped)
+                self._dropped = 0
+                self._last_drop_warning = now
+    
     def create_and_send_message(self, sender_interface, frame_id, signal_values):
         """
         Create and send a CAN message on the sender interface
@@ -86,9 +159,6 @@ class MessageProcessor(QObject):
             if data:
                 self.logger.info(f"Successfully encoded message: {' '.join(f'{b:02X}' for b in data)}")
             
-                # Get message definition
-                message = self.dbc_parser.get_message_by_id(frame_id)
-            
                 # Create CAN message
                 can_msg = can.Message(
                     arbitration_id=frame_id,
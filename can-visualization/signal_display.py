@@ -3,8 +3,26 @@ from PyQt5.QtWidgets import (QWidget, QTableWidget, QTableWidgetItem, QVBoxLayou
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QColor
 import pyqtgraph as pg
+import numpy as np
 import logging
 import time
+from collections import OrderedDict
+
+from signal_history import SignalHistory
+
+# Most signal histories kept by the plot; the least recently updated signal is
+# dropped beyond this so memory stays bounded on busy networks
+MAX_PLOT_SIGNALS = 4096
+
+class SignalRow:
+    """Latest value and update times of one signal table row"""
+    __slots__ = ('row', 'text', 'updated', 'shown')
+    
+    def __init__(self, row, text, updated):
+        self.row = row  # table row index
+        self.text = text  # formatted latest value
+        self.updated = updated  # time of the latest value
+        self.shown = updated  # time the row was last redrawn
 
 class SignalTableWidget(QWidget):
     """
@@ -15,9 +33,9 @@ class SignalTableWidget(QWidget):
         self.logger = logging.getLogger("SignalTableWidget")
         
         # Store signal data
-        self.signal_values = {}  # {signal_name: value}
-        self.signal_timestamps = {}  # {signal_name: last_update_time}
         self.stale_threshold = 5.0  # seconds before a signal is considered stale
+        self.min_update_interval = 1 / 30  # seconds between redraws of one row
+        self.pending_rows = set()  # SignalRows whose latest value isn't drawn yet
         
         # Set up the layout
         layout = QVBoxLayout(self)
@@ -51,24 +69,52 @@ class SignalTableWidget(QWidget):
         self.stale_timer.timeout.connect(self.check_stale_signals)
         self.stale_timer.start(1000)  # Check every second
         
+        # Draws values held back by the per-row rate limit, so a signal that
+        # stops changing still ends up showing its latest value
+        self.pending_timer = QTimer(self)
+        self.pending_timer.setSingleShot(True)
+        self.pending_timer.setTimerType(Qt.CoarseTimer)
+        self.pending_timer.timeout.connect(self.flush_pending_rows)
+        
         # Internal data
         self.messages = set()
         self.interfaces = set()
-        self.rows = {}  # Map (msg_name, signal_name, interface) to row index
+        self.rows = {}  # Map (msg_name, signal_name, interface) to SignalRow
     
     def update_signal(self, msg_id, msg_name, signal_name, value, unit, interface):
         """Update a signal value in the table"""
-        current_time = time.time()
-        
-        # Update internal data
-        self.messages.add(msg_name)
-        self.interfaces.add(interface)
+        self._store_signal(msg_name, signal_name, value, unit, interface, time.time())
         
-        # Update filter dropdowns if needed
-        if msg_name not in [self.msg_filter.itemText(i) for i in range(self.msg_filter.count())]:
+        # Apply filters (in case they've been set)
+        self.apply_filters()
+    
+    def update_signals(self, msg_id, msg_name, signals, units, interface, timestamp=None):
+        """
+        Update every signal decoded from one CAN frame in a single pass
+        
+        Args:
+            signals: Dictionary of signal names and values
+            units: Dictionary of signal names and units
+            timestamp: Arrival time shared by the frame's signals (default: now)
+        """
+        current_time = time.time() if timestamp is None else timestamp
+        for signal_name, value in signals.items():
+            self._store_signal(msg_name, signal_name, value, units.get(signal_name, ""),
+                               interface, current_time)
+        
+        # Filters only need to be re-applied once per frame
+        self.apply_filters()
+    
+    def _store_signal(self, msg_name, signal_name, value, unit, interface, current_time):
+        """Store a signal value and refresh its table row"""
+        # Update internal data and filter dropdowns; the sets mirror the
+        # dropdown contents so membership checks don't walk the combo boxes
+        if msg_name not in self.messages:
+            self.messages.add(msg_name)
             self.msg_filter.addItem(msg_name)
         
-        if interface not in [self.iface_filter.itemText(i) for i in range(self.iface_filter.count())]:
+        if interface not in self.interfaces:
+            self.interfaces.add(interface)
             self.iface_filter.addItem(interface)
         
         key = (msg_name, signal_name, interface)
@@ -79,15 +125,12 @@ class SignalTableWidget(QWidget):
         else:
             formatted_value = str(value)
         
-        # Store value and timestamp
-        self.signal_values[key] = formatted_value
-        self.signal_timestamps[key] = current_time
-        
         # Check if we need to add a new row
-        if key not in self.rows:
+        state = self.rows.get(key)
+        if state is None:
             row = self.table.rowCount()
             self.table.insertRow(row)
-            self.rows[key] = row
+            self.rows[key] = SignalRow(row, formatted_value, current_time)
             
             self.table.setItem(row, 0, QTableWidgetItem(msg_name))
             self.table.setItem(row, 1, QTableWidgetItem(signal_name))
@@ -95,32 +138,49 @@ class SignalTableWidget(QWidget):
             self.table.setItem(row, 3, QTableWidgetItem(unit if unit else ""))
             self.table.setItem(row, 4, QTableWidgetItem(interface))
         else:
-            # Update existing row
-            row = self.rows[key]
+            # Store value and timestamp
+            state.text = formatted_value
+            state.updated = current_time
+            
+            # Update existing row, at most once per min_update_interval; faster
+            # changes are stored above and drawn by flush_pending_rows
+            if current_time - state.shown < self.min_update_interval:
+                if not self.pending_rows:
+                    self.pending_timer.start(int(self.min_update_interval * 1000))
+                self.pending_rows.add(state)
+                return
+            row = state.row
             self.table.item(row, 2).setText(formatted_value)
+            state.shown = current_time
+            self.pending_rows.discard(state)
         
         # Color code based on recency
         self.color_code_row(row, 0)  # Fresh update
-        
-        # Apply filters (in case they've been set)
-        self.apply_filters()
+    
+    def flush_pending_rows(self):
+        """Draw the latest value of every row held back by the rate limit"""
+        current_time = time.time()
+        for state in self.pending_rows:
+            self.table.item(state.row, 2).setText(state.text)
+            state.shown = current_time
+            self.color_code_row(state.row, current_time - state.updated)
+        self.pending_rows.clear()
     
     def check_stale_signals(self):
         """Check for and highlight stale signals"""
         current_time = time.time()
         
-        for key, timestamp in self.signal_timestamps.items():
-            if key in self.rows:
-                age = current_time - timestamp
-                row = self.rows[key]
-                
-                if age < self.stale_threshold:
-                    # Normal - use color coding by age
-                    self.color_code_row(row, age)
-                else:
-                    # Stale - highlight in gray
-                    for col in range(self.table.columnCount()):
-                        self.table.item(row, col).setBackground(QColor(200, 200, 200))
+        for state in self.rows.values():
+            age = current_time - state.updated
+            row = state.row
+            
+            if age < self.stale_threshold:
+                # Normal - use color coding by age
+                self.color_code_row(row, age)
+            else:
+                # Stale - highlight in gray
+                for col in range(self.table.columnCount()):
+                    self.table.item(row, col).setBackground(QColor(200, 200, 200))
     
     def color_code_row(self, row, age):
         """Color code a row based on update age"""
@@ -145,7 +205,7 @@ class SignalTableWidget(QWidget):
         selected_msg = self.msg_filter.currentText()
         selected_iface = self.iface_filter.currentText()
         
-        for key, row in self.rows.items():
+        for key, state in self.rows.items():
             msg_name, _, interface = key
             
             # Determine if this row should be visible
@@ -153,7 +213,7 @@ class SignalTableWidget(QWidget):
             show_by_iface = (selected_iface == "All Interfaces" or selected_iface == interface)
             
             # Show or hide the row
-            self.table.setRowHidden(row, not (show_by_msg and show_by_iface))
+            self.table.setRowHidden(state.row, not (show_by_msg and show_by_iface))
 
 class SignalPlotWidget(QWidget):
     """
@@ -195,9 +255,10 @@ class SignalPlotWidget(QWidget):
         layout.addWidget(self.plot_widget)
         
         # Data storage
-        self.data = {}  # {signal_key: {'timestamps': [], 'values': []}}
+        self.data = OrderedDict()  # {signal_key: SignalHistory}, least recently updated first
         self.plot_items = {}  # {signal_key: PlotDataItem}
         self.signal_keys = []  # List of all signal keys
+        self.key_names = {}  # {(msg_name, signal_name, interface): signal_key}
         self.current_signal = None
         
         # Time window values in seconds
@@ -211,22 +272,53 @@ class SignalPlotWidget(QWidget):
     
     def add_data_point(self, msg_id, msg_name, signal_name, value, unit, interface):
         """Add a data point to the signal plot"""
-        current_time = time.time()
+        signal_key = self._append_point(msg_name, signal_name, value, unit, interface, time.time())
         
-        # Create a unique key for this signal
-        signal_key = f"{msg_name}.{signal_name} ({interface})"
+        # Update the plot if this is the currently selected signal
+        if self.signal_selector.currentText() == signal_key:
+            self.update_plot()
+    
+    def add_data_points(self, msg_id, msg_name, signals, units, interface, timestamp=None):
+        """
+        Add every signal decoded from one CAN frame, redrawing at most once
+        
+        Args:
+            signals: Dictionary of signal names and values
+            units: Dictionary of signal names and units
+            timestamp: Arrival time shared by the frame's signals (default: now)
+        """
+        current_time = time.time() if timestamp is None else timestamp
+        current_key = self.signal_selector.currentText()
+        redraw = False
+        for signal_name, value in signals.items():
+            signal_key = self._append_point(msg_name, signal_name, value,
+                                            units.get(signal_name, ""), interface, current_time)
+            redraw = redraw or signal_key == current_key
+        
+        if redraw:
+            self.update_plot()
+    
+    def _append_point(self, msg_name, signal_name, value, unit, interface, current_time):
+        """Append a sample to a signal's history and return its signal key"""
+        # Look up the unique key for this signal, composing it the first time
+        names = (msg_name, signal_name, interface)
+        signal_key = self.key_names.get(names)
+        if signal_key is None:
+            if len(self.key_names) >= 2 * MAX_PLOT_SIGNALS:
+                # Keys of evicted signals pile up here; start over rather than track them
+                self.key_names.clear()
+            signal_key = self.key_names[names] = f"{msg_name}.{signal_name} ({interface})"
         
         # Add to the signal selector if this is a new signal
-        if signal_key not in self.signal_keys:
+        if signal_key not in self.data:
             self.signal_keys.append(signal_key)
             self.signal_selector.addItem(signal_key)
             
-            # Initialize data storage
-            self.data[signal_key] = {
-                'timestamps': [],
-                'values': [],
-                'unit': unit
-            }
+            # Initialize data storage (preallocated ring buffer)
+            self.data[signal_key] = SignalHistory(unit)
+            
+            if len(self.data) > MAX_PLOT_SIGNALS:
+                self._evict_oldest_signal()
             
             # Create a plot item
             pen = pg.mkPen(color=(0, 0, 255), width=2)
@@ -234,19 +326,28 @@ class SignalPlotWidget(QWidget):
                 [], [], pen=pen, name=signal_key
             )
         
-        # Add the data point
-        self.data[signal_key]['timestamps'].append(current_time)
-        self.data[signal_key]['values'].append(float(value) if isinstance(value, (int, float)) else 0)
-        
-        # Limit data points (to avoid memory issues)
-        max_points = 1000
-        if len(self.data[signal_key]['timestamps']) > max_points:
-            self.data[signal_key]['timestamps'] = self.data[signal_key]['timestamps'][-max_points:]
-            self.data[signal_key]['values'] = self.data[signal_key]['values'][-max_points:]
+        # Add the data point, overwriting the oldest sample once the buffer is full
+        self.data[signal_key].append(current_time, float(value) if isinstance(value, (int, float)) else 0)
+        self.data.move_to_end(signal_key)
+        return signal_key
+    
+    def _evict_oldest_signal(self):
+        """Drop the least recently updated signal, keeping the one on screen"""
+        for signal_key in self.data:
+            if signal_key != self.current_signal:
+                break
+        else:
+            return
         
-        # Update the plot if this is the currently selected signal
-        if self.signal_selector.currentText() == signal_key:
-            self.update_plot()
+        del self.data[signal_key]
+        self.plot_widget.removeItem(self.plot_items.pop(signal_key))
+        self.signal_keys.remove(signal_key)
+        self.signal_selector.removeItem(self.signal_selector.findText(signal_key))
+        self.logger.debug("Evicted plot history for %s", signal_key)
+    
+    def get_history(self, signal_key):
+        """Return (timestamps, values) for a signal in arrival order"""
+        return self.data[signal_key].snapshot()
     
     def update_plot(self):
         """Update the plot with the currently selected signal"""
@@ -257,16 +358,14 @@ class SignalPlotWidget(QWidget):
         self.current_signal = signal_key
         
         # Get the data
-        timestamps = self.data[signal_key]['timestamps']
-        values = self.data[signal_key]['values']
-        unit = self.data[signal_key]['unit']
+        timestamps, values = self.get_history(signal_key)
+        unit = self.data[signal_key].unit
         
-        if not timestamps:
+        if not len(timestamps):
             return
         
         # Convert absolute timestamps to relative times (seconds from start)
-        start_time = timestamps[0]
-        relative_times = [t - start_time for t in timestamps]
+        relative_times = timestamps - timestamps[0]
         
         # Update the plot
         self.plot_items[signal_key].setData(relative_times, values)
@@ -275,43 +374,42 @@ class SignalPlotWidget(QWidget):
         self.plot_widget.setTitle(signal_key)
         self.plot_widget.setLabel('left', f'Value ({unit})' if unit else 'Value')
         
-        # Update axis range
-        self.update_plot_range()
+        # Update axis range from the same snapshot
+        self._apply_plot_range(relative_times, values)
     
     def update_plot_range(self):
         """Update the plot's time axis range based on selected time window"""
-        if not self.current_signal or not self.data.get(self.current_signal, {}).get('timestamps'):
+        history = self.data.get(self.current_signal)
+        if history is None or not history.size:
             return
         
+        timestamps, values = history.snapshot()
+        self._apply_plot_range(timestamps - timestamps[0], values)
+    
+    def _apply_plot_range(self, relative_times, values):
+        """Set the axis ranges for a history snapshot (times relative to its first sample)"""
         # Get the time window in seconds
         window_idx = self.time_window.currentIndex()
         window_seconds = self.time_windows.get(window_idx, 60)
         
-        # Calculate the x-axis range
-        timestamps = self.data[self.current_signal]['timestamps']
-        start_time = timestamps[0]
-        relative_times = [t - start_time for t in timestamps]
+        # Set x-axis to show the selected time window
+        max_time = relative_times[-1]
+        min_time = max(0, max_time - window_seconds)
+        self.plot_widget.setXRange(min_time, max_time)
         
-        if relative_times:
-            # Set x-axis to show the selected time window
-            max_time = relative_times[-1]
-            min_time = max(0, max_time - window_seconds)
-            self.plot_widget.setXRange(min_time, max_time)
-            
-            # Set y-axis to show all values in the visible range
-            visible_values = [v for t, v in zip(relative_times, self.data[self.current_signal]['values'])
-                            if min_time <= t <= max_time]
-            
-            if visible_values:
-                min_val = min(visible_values)
-                max_val = max(visible_values)
-                padding = (max_val - min_val) * 0.1 if max_val != min_val else 1.0
-                self.plot_widget.setYRange(min_val - padding, max_val + padding)
+        # Set y-axis to show all values in the visible range; samples are in
+        # arrival order, so the window starts at a binary-searched index
+        visible_values = values[np.searchsorted(relative_times, min_time):]
+        
+        if len(visible_values):
+            min_val = float(visible_values.min())
+            max_val = float(visible_values.max())
+            padding = (max_val - min_val) * 0.1 if max_val != min_val else 1.0
+            self.plot_widget.setYRange(min_val - padding, max_val + padding)
     
     def clear_data(self):
         """Clear all plot data"""
         if self.current_signal:
-            self.data[self.current_signal]['timestamps'] = []
-            self.data[self.current_signal]['values'] = []
+            self.data[self.current_signal].clear()
             self.plot_items[self.current_signal].clear()
             self.logger.info(f"Cleared plot data for {self.current_signal}")
\ No newline at end of file
@@ -0,0 +1,44 @@
+import numpy as np
+
+# Per-signal history length for the plot ring buffers (power of two so the
+# write cursor can wrap with a mask instead of a modulo)
+HISTORY_SIZE = 1024
+HISTORY_MASK = HISTORY_SIZE - 1
+
+class SignalHistory:
+    """Fixed-size ring buffer of (timestamp, value) samples for one signal"""
+    __slots__ = ('timestamps', 'values', 'head', 'size', 'unit', 'current_value')
+
+    def __init__(self, unit=""):
+        self.timestamps = np.empty(HISTORY_SIZE, dtype=np.float64)
+        self.values = np.empty(HISTORY_SIZE, dtype=np.float64)
+        self.head = 0
+        self.size = 0
+        self.unit = unit
+        self.current_value = None
+
+    def append(self, timestamp, value):
+        """Add a sample, overwriting the oldest one once the buffer is full"""
+        head = self.head
+        self.timestamps[head] = timestamp
+        self.values[head] = value
+        self.current_value = value
+        self.head = (head + 1) & HISTORY_MASK
+        if self.size < HISTORY_SIZE:
+            self.size += 1
+
+    def snapshot(self):
+        """Return (timestamps, values) in arrival order as ndarrays"""
+        # Read the cursor once so the slices below agree with each other
+        head, size = self.head, self.size
+        if size < HISTORY_SIZE:
+            # Buffer has not wrapped yet - the samples are a contiguous prefix
+            return self.timestamps[:size], self.values[:size]
+        return (np.concatenate((self.timestamps[head:], self.timestamps[:head])),
+                np.concatenate((self.values[head:], self.values[:head])))
+
+    def clear(self):
+        """Drop all samples"""
+        self.head = 0
+        self.size = 0
+        self.current_value = None
@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem,
-                           QPushButton, QLabel, QLineEdit, QCheckBox, QMessageBox,
-                           QGroupBox, QSplitter, QApplication, QHeaderView, QComboBox)
+                           QPushButton, QLabel, QLineEdit, QMessageBox,
+                           QGroupBox, QSplitter, QHeaderView, QComboBox, QInputDialog)
 from PyQt5.QtCore import Qt, QSettings, pyqtSignal
 import logging
 
@@ -443,7 +443,6 @@ class SignalSelectionDialog(QDialog):
             existing_profiles = {}
         
         # Prompt for profile name
-        from PyQt5.QtWidgets import QInputDialog
         profile_name, ok = QInputDialog.getText(
             self, "Save Profile", "Enter a name for this profile:"
         )
@@ -464,7 +463,6 @@ class SignalSelectionDialog(QDialog):
             return
         
         # Let user select a profile
-        from PyQt5.QtWidgets import QInputDialog
         profile_name, ok = QInputDialog.getItem(
             self, "Load Profile", "Select a profile to load:",
             list(profiles.keys()), 0, False
@@ -486,25 +484,13 @@ class SignalSelectionDialog(QDialog):
                 msg_id_str, signal_name = signal_id.split(":", 1)
                 msg_id = int(msg_id_str)
                 
-                # Get message information
-                message = self.dbc_parser.get_message_by_id(msg_id)
-                if not message:
+                # Look the signal up directly instead of scanning the message
+                info = self.dbc_parser.get_signal_info(msg_id, signal_name)
+                if info is None:
                     continue
-                    
-                # Find the signal in the message
-                signal_data = None
-                for signal in message.signals:
-                    if signal.name == signal_name:
-                        signal_data = {
-                            'type': 'signal',
-                            'message_id': msg_id,
-                            'message_name': message.name,
-                            'signal_name': signal_name,
-                            'unit': signal.unit or ""
-                        }
-                        break
+                signal_data = {'type': 'signal', **info}
                 
-                if signal_data and len(self.selected_signals) < self.max_signals:
+                if len(self.selected_signals) < self.max_signals:
                     self.selected_signals.append(signal_data)
                     
                     # Check the corresponding item in the tree
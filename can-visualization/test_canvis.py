@@ -2,49 +2,408 @@
 """
 Test script for CAN visualization system
 This script allows testing the system in simulation mode with a specified DBC file
+
+Run it with --dbc to launch the application; the test cases below run with
+python -m unittest test_canvis (or pytest)
 """
 
 import sys
 import os
 import argparse
 import logging
+import random
+import threading
 import time
+import unittest
+import numpy as np
+from unittest import mock
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QApplication
 
-# Set up command line arguments
-parser = argparse.ArgumentParser(description='Test CAN Data Visualization')
-parser.add_argument('--dbc', required=True, help='Path to DBC file for testing')
-parser.add_argument('--log', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
-                   default='INFO', help='Logging level')
-args = parser.parse_args()
-
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, args.log),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+import can_simulator
+from can_simulator import DualCANSimulator
+from dbc_parser import DBCParser
+from message_processor import MessageProcessor, MAX_PENDING_MESSAGES
+from signal_history import SignalHistory, HISTORY_SIZE
+import configurable_dashboard_view
+from configurable_dashboard_view import ConfigurableDashboardView, DashboardBridge
+import dashboard_view
+from dashboard_view import DashboardView, DashboardViewBridge
+
 logger = logging.getLogger("Test")
 
-# Check if DBC file exists
-if not os.path.isfile(args.dbc):
-    logger.error(f"DBC file not found: {args.dbc}")
-    sys.exit(1)
+# DBC files shipped with the application
+HERE = os.path.dirname(os.path.abspath(__file__))
+BUNDLED_DBCS = [os.path.join(HERE, name) for name in
+                ("CSS-Electronics-SAE-J1939-DEMO.dbc", "j1939_DBC_EXAMPLE.dbc")]
+
+def wait_for(condition, timeout=2.0):
+    """Poll condition until it is true or timeout seconds have passed"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+def qt_app():
+    """The running QApplication, created without a display if there is none"""
+    app = QApplication.instance()
+    if app is None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        app = QApplication([])
+    return app
+
+class TrendGeneratorTest(unittest.TestCase):
+    """Simulated signal walks stay inside the signal's range"""
+    
+    def walk_kernels(self):
+        """The walk as the simulator runs it, plus the plain loop numba compiles"""
+        yield can_simulator._clamped_walk
+        if can_simulator.HAS_NUMBA:
+            yield can_simulator._clamped_walk.py_func
+    
+    def test_walk_clamps_every_step(self):
+        for kernel in self.walk_kernels():
+            # Clamping the summed walk instead would give [10, 10, 10]
+            walk = np.array([5.0, -1.0, -1.0])
+            kernel(walk, 9.0, 0.0, 10.0)
+            self.assertEqual(walk.tolist(), [10.0, 9.0, 8.0])
+    
+    def test_values_stay_in_bounds(self):
+        generator = can_simulator.TrendGenerator(0, 10, volatility=5)
+        values = [generator.next_value() for _ in range(can_simulator.TREND_BATCH_SIZE * 4)]
+        self.assertTrue(all(0 <= value <= 10 for value in values))
+        self.assertTrue(all(type(value) is float for value in values))
+
+class SimulatorRestartTest(unittest.TestCase):
+    """DualCANSimulator keeps delivering messages across stop/start cycles"""
+    
+    def setUp(self):
+        self.sim = DualCANSimulator(DBCParser(BUNDLED_DBCS[0]))
+        self.received = []
+        self.sim.add_receiver_batch_callback(lambda batch, role: self.received.extend(batch))
+    
+    def tearDown(self):
+        self.sim.stop()
+    
+    def assert_delivers(self):
+        count = len(self.received)
+        self.assertTrue(wait_for(lambda: len(self.received) > count),
+                        "no messages delivered")
+        self.assertTrue(self.sim.dispatcher_thread.is_alive())
+    
+    def test_start_stop_start(self):
+        self.sim.start()
+        self.assert_delivers()
+        self.sim.stop()
+        self.sim.stop()
+        self.sim.start()
+        self.assert_delivers()
+    
+    def test_stop_before_start(self):
+        self.sim.stop()
+        self.sim.start()
+        self.assert_delivers()
+    
+    def test_restart_leaves_one_scheduler(self):
+        self.sim.start()
+        self.sim.stop()
+        self.sim.start()
+        self.assert_delivers()
+        simulators = [t for t in threading.enumerate()
+                      if getattr(t, '_target', None) == self.sim._simulation_loop]
+        self.assertEqual(len(simulators), 1)
+
+class DBCCodecTest(unittest.TestCase):
+    """Generated decoders/encoders in DBCParser match cantools on the bundled DBCs"""
+    
+    @classmethod
+    def setUpClass(cls):
+        # Mismatched payloads are expected below; keep their errors out of the output
+        logging.getLogger("DBCParser").setLevel(logging.CRITICAL)
+        cls.parsers = [DBCParser(path) for path in BUNDLED_DBCS]
+        cls.rng = random.Random(1939)
+    
+    def messages(self):
+        """(parser, message) for every message the parser resolves by its own ID"""
+        for parser in self.parsers:
+            for message in parser.db.messages:
+                if parser.get_message_by_id(message.frame_id) is message:
+                    yield parser, message
+    
+    def payloads(self, length, count=20):
+        """Random payloads plus all-zero and all-one ones (sign bits, extremes)"""
+        yield bytes(length)
+        yield b'\xff' * length
+        for _ in range(count):
+            yield bytes(self.rng.getrandbits(8) for _ in range(length))
+    
+    @staticmethod
+    def cantools_result(function, *args, **kwargs):
+        """cantools' result, or None where DBCParser reports an error as None"""
+        try:
+            return function(*args, **kwargs)
+        except Exception:
+            return None
+    
+    def assert_decodes_like_cantools(self, parser, message, data):
+        expected = self.cantools_result(message.decode, data)
+        self.assertEqual(parser.decode_message(message.frame_id, data), expected,
+                         f"{message.name} decoding {data.hex()}")
+    
+    def test_decode_matches_cantools(self):
+        for parser, message in self.messages():
+            for data in self.payloads(message.length):
+                self.assert_decodes_like_cantools(parser, message, data)
+    
+    def test_decode_short_and_long_payloads(self):
+        for parser, message in self.messages():
+            for length in (max(message.length - 1, 0), message.length + 3):
+                for data in self.payloads(length, count=3):
+                    self.assert_decodes_like_cantools(parser, message, data)
+    
+    def test_encode_matches_cantools(self):
+        for parser, message in self.messages():
+            for data in self.payloads(message.length):
+                # Numeric values take the generated encoder, choice names the
+                # cantools fallback; both must give cantools' bytes or error
+                for decode_choices in (False, True):
+                    values = self.cantools_result(message.decode, data, decode_choices=decode_choices)
+                    if values is None:
+                        continue
+                    expected = self.cantools_result(message.encode, values)
+                    self.assertEqual(parser.encode_message(message.frame_id, values), expected,
+                                     f"{message.name} encoding {values}")
+    
+    def test_encode_rejects_what_cantools_rejects(self):
+        for parser, message in self.messages():
+            values = self.cantools_result(message.decode, bytes(message.length), decode_choices=False)
+            if not values:
+                continue
+            first = message.get_signal_by_name(next(iter(values)))
+            missing = dict(values)
+            missing.pop(first.name)
+            too_large = dict(values)
+            too_large[first.name] = (first.maximum if first.maximum is not None else 0) + 1e9
+            for bad in (missing, too_large):
+                expected = self.cantools_result(message.encode, bad)
+                self.assertEqual(parser.encode_message(message.frame_id, bad), expected,
+                                 f"{message.name} encoding {bad}")
+    
+    def test_bundled_dbcs_cover_special_layouts(self):
+        # Guards the tests above against the DBCs losing the cases they exercise
+        signals = [signal for _, message in self.messages() for signal in message.signals]
+        self.assertTrue(any(signal.byte_order == 'big_endian' for signal in signals))
+        self.assertTrue(any(signal.is_signed for signal in signals))
+        self.assertTrue(any(signal.choices for signal in signals))
+
+class SignalHistoryTest(unittest.TestCase):
+    """SignalHistory keeps the newest HISTORY_SIZE samples in arrival order"""
+    
+    def fill(self, history, count):
+        for i in range(count):
+            history.append(float(i), i * 10.0)
+    
+    def assert_snapshot(self, history, first, last):
+        """Snapshot holds samples first..last-1, oldest first"""
+        timestamps, values = history.snapshot()
+        self.assertEqual(timestamps.tolist(), [float(i) for i in range(first, last)])
+        self.assertEqual(values.tolist(), [i * 10.0 for i in range(first, last)])
+    
+    def test_partial_buffer(self):
+        history = SignalHistory()
+        self.fill(history, 5)
+        self.assert_snapshot(history, 0, 5)
+        self.assertEqual(history.current_value, 40.0)
+    
+    def test_exactly_full(self):
+        history = SignalHistory()
+        self.fill(history, HISTORY_SIZE)
+        self.assertEqual(history.head, 0)
+        self.assert_snapshot(history, 0, HISTORY_SIZE)
+    
+    def test_wraparound_overwrites_oldest(self):
+        history = SignalHistory()
+        count = HISTORY_SIZE * 2 + 7
+        self.fill(history, count)
+        self.assertEqual(history.size, HISTORY_SIZE)
+        self.assertEqual(history.head, 7)
+        self.assert_snapshot(history, count - HISTORY_SIZE, count)
+        self.assertEqual(history.current_value, (count - 1) * 10.0)
+    
+    def test_clear(self):
+        history = SignalHistory("rpm")
+        self.fill(history, HISTORY_SIZE + 3)
+        history.clear()
+        self.assert_snapshot(history, 0, 0)
+        self.assertIsNone(history.current_value)
+        self.assertEqual(history.unit, "rpm")
+        # Filling again after a wrapped buffer was cleared starts from scratch
+        self.fill(history, 3)
+        self.assert_snapshot(history, 0, 3)
+
+class ConfigurableDashboardUpdateTest(unittest.TestCase):
+    """Values reach the page once, and again if their payload was lost"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.app = qt_app()
+    
+    def setUp(self):
+        self.view = ConfigurableDashboardView()
+        # Stand in for the page's bridge, which needs QtWebEngine
+        self.view.bridge = DashboardBridge(self.view)
+        self.sent = []
+        self.view.bridge.dataReady.connect(self.sent.append)
+        self.view.add_widget({"viz_type": "gauge", "widget_size": "small",
+                              "message_name": "EEC1", "signal_name": "EngineSpeed",
+                              "unit": "rpm"})
+    
+    def flush(self, value):
+        """Deliver a message and run one update through the serializer"""
+        self.view.on_message_decoded(0x0CF00400, "EEC1", {"EngineSpeed": value}, "receiver")
+        self.view.update_dashboard()
+        self.view._serialize_pool.waitForDone()
+        self.app.processEvents()
+        # Stands in for the page acknowledging the payload
+        if self.sent:
+            self.view.on_data_handled()
+    
+    def test_unchanged_value_is_not_resent(self):
+        self.flush(1500.0)
+        self.flush(1500.0)
+        self.assertEqual(self.sent, ['{"EEC1":{"EngineSpeed":1500.0}}'])
+    
+    def test_value_is_resent_after_failed_serialization(self):
+        with self.assertLogs("ConfigurableDashboardView", logging.ERROR), \
+                mock.patch.object(configurable_dashboard_view, "dumps", side_effect=TypeError):
+            self.flush(1500.0)
+        self.assertEqual(self.sent, [])
+        self.flush(1500.0)
+        self.assertEqual(self.sent, ['{"EEC1":{"EngineSpeed":1500.0}}'])
+
+class DashboardViewUpdateTest(unittest.TestCase):
+    """Values reach the page once, and again if their batch was lost"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.app = qt_app()
+    
+    def setUp(self):
+        self.view = DashboardView()
+        # Stand in for the page's bridge, which needs QtWebEngine
+        self.view.bridge = DashboardViewBridge(self.view)
+        self.sent = []
+        self.view.bridge.dataChanged.connect(self.sent.append)
+    
+    def tick(self, value):
+        """Deliver a message and run one timer tick through the serializer"""
+        self.view.on_message_decoded(0x0CF00400, "EEC1", {"EngineSpeed": value}, "receiver")
+        self.view.update_dashboard()
+        self.view._serialize_pool.waitForDone()
+        self.app.processEvents()
+    
+    def test_unchanged_value_is_not_resent(self):
+        self.tick(1500.0)
+        self.tick(1500.0)
+        self.assertEqual(self.sent, ['{"EEC1":{"EngineSpeed":1500.0}}'])
+    
+    def test_value_is_resent_after_failed_serialization(self):
+        with self.assertLogs("DashboardView", logging.ERROR), \
+                mock.patch.object(dashboard_view, "dumps", side_effect=TypeError):
+            self.tick(1500.0)
+        self.assertEqual(self.sent, [])
+        self.tick(1500.0)
+        self.assertEqual(self.sent, ['{"EEC1":{"EngineSpeed":1500.0}}'])
 
-# Add --simulation flag programmatically to sys.argv
-if '--simulation' not in sys.argv:
-    sys.argv.append('--simulation')
+class FakeInterface:
+    """CAN interface stand-in with no receivers, so nothing but the test posts"""
+    interfaces = {}
 
-# Import the main application
-try:
-    from main_app import CANVisApp
-    logger.info("Successfully imported the main application")
-except ImportError as e:
-    logger.error(f"Failed to import the main application: {e}")
-    logger.error("Make sure all required modules are installed and in the Python path")
-    sys.exit(1)
+class MessageProcessorQueueTest(unittest.TestCase):
+    """Decoded messages posted from receive threads reach the GUI thread"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.app = qt_app()
+    
+    def setUp(self):
+        self.processor = MessageProcessor(FakeInterface(), None)
+        self.received = []
+        self.processor.unknown_message.connect(
+            lambda frame_id, data, interface: self.received.append(frame_id))
+        # Runs on the posting thread, so it counts emissions, not deliveries
+        self.wakeups = []
+        self.processor._pending_ready.connect(lambda: self.wakeups.append(1),
+                                              Qt.DirectConnection)
+    
+    def post_burst(self, frame_ids):
+        """Post one unknown_message per frame ID from a receive thread"""
+        def post():
+            for frame_id in frame_ids:
+                self.processor._post(self.processor.unknown_message,
+                                     (frame_id, "", "receiver"))
+        thread = threading.Thread(target=post)
+        thread.start()
+        thread.join()
+    
+    def test_overflow_drops_oldest(self):
+        extra = 5
+        self.post_burst(range(MAX_PENDING_MESSAGES + extra))
+        with self.assertLogs("MessageProcessor", logging.WARNING) as logs:
+            self.app.processEvents()
+        self.assertEqual(self.received, list(range(extra, MAX_PENDING_MESSAGES + extra)))
+        self.assertIn(f"Dropped {extra} ", logs.output[0])
+    
+    def test_one_wakeup_per_burst(self):
+        self.post_burst(range(100))
+        self.assertEqual(len(self.wakeups), 1)
+        self.assertEqual(self.received, [])
+        self.app.processEvents()
+        self.assertEqual(self.received, list(range(100)))
+    
+    def test_burst_after_drain_is_delivered(self):
+        self.post_burst(range(10))
+        self.app.processEvents()
+        self.post_burst(range(10, 20))
+        self.assertEqual(len(self.wakeups), 2)
+        self.app.processEvents()
+        self.assertEqual(self.received, list(range(20)))
 
 def main():
     """Run the test"""
+    # Set up command line arguments
+    parser = argparse.ArgumentParser(description='Test CAN Data Visualization')
+    parser.add_argument('--dbc', required=True, help='Path to DBC file for testing')
+    parser.add_argument('--log', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
+                       default='INFO', help='Logging level')
+    args = parser.parse_args()
+    
+    # Configure logging
+    logging.basicConfig(
+        level=getattr(logging, args.log),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    # Check if DBC file exists
+    if not os.path.isfile(args.dbc):
+        logger.error(f"DBC file not found: {args.dbc}")
+        sys.exit(1)
+    
+    # Add --simulation flag programmatically to sys.argv
+    if '--simulation' not in sys.argv:
+        sys.argv.append('--simulation')
+    
+    # Import the main application
+    try:
+        from main_app import CANVisApp
+        logger.info("Successfully imported the main application")
+    except ImportError as e:
+        logger.error(f"Failed to import the main application: {e}")
+        logger.error("Make sure all required modules are installed and in the Python path")
+        sys.exit(1)
+    
     # Start Qt application
     app = QApplication(sys.argv)
     
@@ -7,11 +7,24 @@ a simple fallback that can at least let the application start.
 """
 
 import logging
+import os
+import sys
 logger = logging.getLogger("WebEngineWrapper")
 
+# Chromium flags for the canvas-heavy dashboards on Windows, where QtWebEngine
+# often falls back to software rasterization. Chromium reads them when the
+# QApplication is created, so they are set on import; flags the user already
+# set are left alone
+WINDOWS_CHROMIUM_FLAGS = (
+    "--enable-gpu-rasterization --enable-features=CanvasOopRasterization"
+)
+if sys.platform == "win32":
+    os.environ.setdefault("QTWEBENGINE_CHROMIUM_FLAGS", WINDOWS_CHROMIUM_FLAGS)
+
 try:
     # Try to import the real QWebEngineView
     from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings
+    from PyQt5.QtWebChannel import QWebChannel
     logger.info("Successfully imported PyQtWebEngineWidgets")
     HAS_WEBENGINE = True
 except ImportError:
@@ -59,6 +72,16 @@ except ImportError:
         def setAttribute(attr, value):
             """Stub for setAttribute"""
             pass
+    
+    class QWebChannel:
+        """Stub for QWebChannel"""
+        
+        def __init__(self, parent=None):
+            pass
+        
+        def registerObject(self, name, obj):
+            """Stub for registerObject method"""
+            pass
 
 # Export the classes
-__all__ = ["QWebEngineView", "QWebEngineSettings", "HAS_WEBENGINE"]
\ No newline at end of file
+__all__ = ["QWebEngineView", "QWebEngineSettings", "QWebChannel", "HAS_WEBENGINE"]
\ No newline at end of file